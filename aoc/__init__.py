@@ -0,0 +1,24 @@
+import importlib
+
+
+# Day scripts import aoc.grid / aoc.inputs on their own, so the package mustn't drag in the runner
+# (and multiprocessing, sqlite3, ...) with them; these names are only imported on first use
+LAZY = {
+    "Day": "aoc.days",
+    "discover": "aoc.days",
+    "get_day": "aoc.days",
+    "Task": "aoc.runner",
+    "TaskResult": "aoc.runner",
+    "execute": "aoc.runner",
+    "run_tasks": "aoc.runner",
+}
+
+__all__ = ["Day", "Task", "TaskResult", "discover", "execute", "get_day", "run_tasks"]
+
+
+def __getattr__(name: str):
+    if name not in LAZY:
+        raise AttributeError(f"module 'aoc' has no attribute {name!r}")
+    value = getattr(importlib.import_module(LAZY[name]), name)
+    globals()[name] = value
+    return value
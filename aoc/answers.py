@@ -0,0 +1,88 @@
+"""Persistent store of solver answers.
+
+Answers are keyed on (day, part, input SHA-256, solver SHA-256), where the solver digest covers the
+day's run.py and the modules of the aoc package it imports (e.g. aoc.grid), so editing a day only
+invalidates that day's answers. The imports are found by scanning the source, so a lookup never has
+to import the day (and numpy or sympy with it).
+"""
+
+import hashlib
+import pickle
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+from aoc.cache import file_digest
+from aoc.days import ROOT
+
+
+ANSWERS_PATH = ROOT / ".cache" / "answers.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    input_digest TEXT NOT NULL,
+    solver_digest TEXT NOT NULL,
+    answer BLOB NOT NULL,
+    solve_time REAL NOT NULL,
+    PRIMARY KEY (day, part, input_digest, solver_digest)
+)
+"""
+
+
+def package_imports(source: str) -> set[Path]:
+    names = set(re.findall(r"^\s*(?:from|import) aoc\.(\w+)", source, re.MULTILINE))
+    for imported in re.findall(r"^\s*from aoc import (.+)$", source, re.MULTILINE):
+        names |= {name.split()[0] for name in imported.strip("()").split(",") if name.strip()}
+    package = ROOT / "aoc"
+    candidates = [p for name in names for p in (package / f"{name}.py", package / name / "__init__.py")]
+    return {p for p in candidates if p.exists()}
+
+
+def solver_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    for p in [path, *sorted(package_imports(path.read_text()))]:
+        h.update(file_digest(p).encode())
+    return h.hexdigest()
+
+
+class AnswerStore:
+    def __init__(self, path: Path = ANSWERS_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Several workers write at once; WAL lets readers carry on while one of them commits
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(SCHEMA)
+
+    def get(self, day: int, part: int, input_digest: str, solver: str) -> Optional[Any]:
+        row = self.db.execute(
+            "SELECT answer FROM answers"
+            " WHERE day = ? AND part = ? AND input_digest = ? AND solver_digest = ?",
+            (day, part, input_digest, solver),
+        ).fetchone()
+        return None if (row is None) else pickle.loads(row[0])
+
+    def put(
+        self,
+        day: int,
+        part: int,
+        input_digest: str,
+        solver: str,
+        answer: Any,
+        solve_time: float,
+    ) -> None:
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)",
+                (day, part, input_digest, solver, pickle.dumps(answer), solve_time),
+            )
+
+    def close(self) -> None:
+        self.db.close()
+
+
+def clear(path: Path = ANSWERS_PATH) -> None:
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
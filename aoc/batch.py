@@ -0,0 +1,67 @@
+"""Run one day over many input files on a long-lived worker pool.
+
+Each worker imports the day (and numpy, sympy, ...) once when it starts, so the cost per input is
+just load() and the solvers. Results stream out in completion order.
+"""
+
+import glob
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from aoc.days import PARTS, get_day
+from aoc.runner import RunOptions, Task, TaskResult, execute_group, group_tasks
+
+
+def expand_inputs(patterns: Iterable[str]) -> list[Path]:
+    # Each pattern is a file, a directory (every file in it) or a glob
+    paths = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths += sorted(p for p in path.iterdir() if p.is_file())
+        elif path.is_file():
+            paths += [path]
+        else:
+            paths += sorted(Path(p) for p in glob.glob(pattern, recursive=True) if Path(p).is_file())
+    return list(dict.fromkeys(p.resolve() for p in paths))
+
+
+def warm_up(day: int) -> None:
+    get_day(day).load_module()
+
+
+def run_batch(
+    day: int,
+    paths: list[Path],
+    parts: Iterable[int] = PARTS,
+    jobs: Optional[int] = None,
+    options: RunOptions = RunOptions(),
+) -> Iterator[TaskResult]:
+    # Absolute paths, so Day.input_path() treats every input name as an explicit file
+    tasks = [Task(day, part, str(path)) for path in paths for part in parts]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=warm_up, initargs=(day,)) as pool:
+        futures = [pool.submit(execute_group, group, options) for group in group_tasks(tasks, options)]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def json_default(value: Any) -> Any:
+    # numpy and sympy integers know how to be Python ints; anything else is shown as text
+    return int(value) if hasattr(value, "__index__") else str(value)
+
+
+def to_json(result: TaskResult) -> str:
+    return json.dumps({
+        "day": result.task.day,
+        "part": result.task.part,
+        "input": result.task.input_name,
+        "status": result.status,
+        "answer": result.answer,
+        "load_time": round(result.load_time, 6),
+        "solve_time": round(result.solve_time, 6),
+        "memoized": result.memoized,
+        "metrics": result.metrics,
+        "error": result.error,
+    }, default=json_default)
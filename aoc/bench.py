@@ -0,0 +1,149 @@
+import json
+import math
+import os
+import platform
+import statistics
+import time
+from contextlib import redirect_stdout
+from copy import deepcopy
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from aoc.cache import cached_load
+from aoc.days import ROOT, Day, get_day, has_combined_solver
+
+
+BASELINE_PATH = ROOT / "benchmarks" / "baseline.json"
+RESULTS_PATH = ROOT / "benchmarks" / "latest.json"
+STAGES = ("load", "pt1", "pt2", "both")
+
+
+@dataclass
+class Stats:
+    min: float
+    median: float
+    p95: float
+    repeats: int
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "Stats":
+        ordered = sorted(samples)
+        p95 = ordered[math.ceil(0.95 * len(ordered)) - 1]  # nearest-rank
+        return cls(ordered[0], statistics.median(ordered), p95, len(ordered))
+
+
+@dataclass
+class Regression:
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def measure(fn: Callable[[], Callable], warmup: int, repeats: int) -> Stats:
+    # fn() does the untimed setup and returns the callable to time
+    samples = []
+    for i in range(warmup + repeats):
+        target = fn()
+        t0 = time.perf_counter()
+        target()
+        elapsed = time.perf_counter() - t0
+        if i >= warmup:
+            samples += [elapsed]
+    return Stats.from_samples(samples)
+
+
+def bench_day(
+    day: Day,
+    input_name: str,
+    warmup: int,
+    repeats: int,
+    use_cache: bool = True,
+) -> dict[str, Stats]:
+    module = day.load_module()
+    results = {}
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        # The load stage always parses; the cache only spares the solver stages' setup
+        path = day.input_path(input_name, 1)
+        results["load"] = measure(lambda: lambda: module.load(path), warmup, repeats)
+        parts = (1, 2)
+        if has_combined_solver(module) and day.shares_input(input_name):
+            parts += (None,)  # the combined solve()
+        for part in parts:
+            path = day.input_path(input_name, part or 1)
+            data = cached_load(module, path) if use_cache else module.load(path)
+
+            def prepare() -> Callable:
+                # Solvers are free to mutate their input, so each repeat gets a fresh copy
+                copy = deepcopy(data)
+                return lambda: day.bind(module, part, input_name, copy)()
+
+            results["both" if (part is None) else f"pt{part}"] = measure(prepare, warmup, repeats)
+    return results
+
+
+def run_benchmarks(
+    days: Iterable[int],
+    inputs: Iterable[str] = ("test",),
+    warmup: int = 1,
+    repeats: int = 5,
+    use_cache: bool = True,
+    log: Optional[Callable[[str], None]] = None,
+) -> dict:
+    results = {}
+    for number in days:
+        day = get_day(number)
+        for input_name in inputs:
+            for (stage, stats) in bench_day(day, input_name, warmup, repeats, use_cache).items():
+                key = f"{day.name}:{input_name}:{stage}"
+                results[key] = {k: round(v, 6) for (k, v) in asdict(stats).items()}
+                if log is not None:
+                    log(format_row(key, stats))
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "warmup": warmup,
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: dict,
+    baseline: dict,
+    threshold: float = 0.25,
+    min_delta: float = 0.005,
+) -> list[Regression]:
+    # Compare medians; tiny absolute differences are timer noise, not regressions
+    regressions = []
+    for (key, stats) in current["results"].items():
+        if key not in baseline["results"]:
+            continue
+        (old, new) = (baseline["results"][key]["median"], stats["median"])
+        if (new > old * (1 + threshold)) and (new - old > min_delta):
+            regressions += [Regression(key, old, new)]
+    return regressions
+
+
+def format_row(key: str, stats: Stats) -> str:
+    return f"{key:<24} min {stats.min:9.4f}s  median {stats.median:9.4f}s  p95 {stats.p95:9.4f}s"
+
+
+def read_json(path: Path) -> dict:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
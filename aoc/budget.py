@@ -0,0 +1,87 @@
+import os
+import re
+import signal
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+
+DAY_PATH = re.compile(r"[/\\]day-\d+[/\\]")
+UNITS = {"s": 1, "m": 60, "kib": 2**10, "mib": 2**20, "gib": 2**30}
+
+
+@dataclass(frozen=True)
+class Budget:
+    time: Optional[float] = None  # seconds
+    memory: Optional[int] = None  # bytes of resident memory
+
+    def __bool__(self) -> bool:
+        return (self.time is not None) or (self.memory is not None)
+
+    @classmethod
+    def parse(cls, limits: str) -> "Budget":
+        # e.g. "30s", "2GiB" or "5m,512MiB"
+        (time, memory) = (None, None)
+        for limit in limits.split(","):
+            match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*(s|m|kib|mib|gib)", limit.strip().lower())
+            if match is None:
+                raise ValueError(f"Invalid limit {limit!r}; expected e.g. 30s, 5m, 512MiB or 2GiB")
+            (value, unit) = (float(match.group(1)), match.group(2))
+            if unit in ("s", "m"):
+                time = value * UNITS[unit]
+            else:
+                memory = int(value * UNITS[unit])
+        return cls(time, memory)
+
+    def merge(self, other: "Budget") -> "Budget":
+        # Limits set in `other` take precedence
+        return Budget(
+            self.time if (other.time is None) else other.time,
+            self.memory if (other.memory is None) else other.memory,
+        )
+
+
+class Interrupted(BaseException):
+    # Raised inside a worker's solver when the runner stops it for going over budget. It derives
+    # from BaseException so solvers' own `except Exception` blocks can't swallow it.
+    def __init__(self, where: str) -> None:
+        super().__init__(where)
+        self.where = where
+        self.profile = None  # filled in by profiling.profile() when the solver was being profiled
+
+
+def solver_stack(frame: Optional[FrameType], limit: int = 8) -> str:
+    # Only the frames from the day's own code inwards; the runner's frames above them are noise
+    stack = traceback.extract_stack(frame) if (frame is not None) else []
+    first = next((i for (i, f) in enumerate(stack) if DAY_PATH.search(f.filename)), len(stack) - limit)
+    return "".join(traceback.format_list(stack[max(first, 0):])).rstrip()
+
+
+def raise_interrupted(signum: int, frame: Optional[FrameType]) -> None:
+    raise Interrupted(solver_stack(frame))
+
+
+def install_interrupt_handler() -> None:
+    signal.signal(signal.SIGTERM, raise_interrupted)
+
+
+def peak_memory(pid: int) -> Optional[int]:
+    # The process's resident high-water mark (VmHWM), which unlike ru_maxrss starts afresh at exec
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, IndexError, ValueError):
+        pass
+    return None
+
+
+def resident_memory(pid: int) -> Optional[int]:
+    # Linux only; other platforms just don't get memory budgets enforced
+    try:
+        resident_pages = int(Path(f"/proc/{pid}/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
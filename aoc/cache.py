@@ -0,0 +1,91 @@
+"""Content-addressed cache of parsed inputs.
+
+Entries are keyed on the input file's SHA-256 and the day's solver digest, which covers run.py and
+the aoc modules it imports: load() may do its parsing in aoc.inputs, say. Editing any of them simply
+misses the old entry.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc.days import ROOT
+
+
+CACHE_DIR = ROOT / ".cache" / "parsed"
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def source_digest(module: ModuleType) -> str:
+    from aoc.answers import solver_digest  # aoc.answers imports this module for file_digest
+    return solver_digest(Path(module.__file__))
+
+
+def cache_key(module: ModuleType, path: Path) -> str:
+    return f"{file_digest(path)[:20]}-{source_digest(module)[:20]}"
+
+
+def is_array(data: Any) -> bool:
+    return type(data).__module__ == "numpy" and type(data).__name__ == "ndarray"
+
+
+def read_npz(path: Path) -> Any:
+    import numpy as np
+    with np.load(path, allow_pickle=False) as f:
+        return f["data"]
+
+
+def write_npz(f, data: Any) -> None:
+    import numpy as np
+    np.savez(f, data=data)
+
+
+def read_pickle(path: Path) -> Any:
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def write_pickle(f, data: Any) -> None:
+    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+FORMATS: dict[str, tuple[Callable, Callable]] = {
+    ".npz": (read_npz, write_npz),
+    ".pkl": (read_pickle, write_pickle),
+}
+
+
+def cached_load(module: ModuleType, path: Path, cache_dir: Path = CACHE_DIR) -> Any:
+    entry = cache_dir / module.__name__ / cache_key(module, path)
+    for (suffix, (reader, _)) in FORMATS.items():
+        if entry.with_suffix(suffix).exists():
+            return reader(entry.with_suffix(suffix))
+
+    data = module.load(path)
+    suffix = ".npz" if is_array(data) else ".pkl"
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so concurrent workers never read a partial entry
+    (fd, tmp_path) = tempfile.mkstemp(dir=entry.parent, suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            FORMATS[suffix][1](f, data)
+        os.replace(tmp_path, entry.with_suffix(suffix))
+    except (pickle.PicklingError, RecursionError, TypeError, AttributeError):
+        os.remove(tmp_path)  # not every parsed structure can be serialised; just don't cache it
+    return data
+
+
+def clear(cache_dir: Path = CACHE_DIR) -> None:
+    shutil.rmtree(cache_dir, ignore_errors=True)
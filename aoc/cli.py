@@ -0,0 +1,312 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from aoc import answers, cache, generators, profiling, scaling
+from aoc.budget import Budget
+from aoc.days import INPUTS, PARTS, default_days
+from aoc.runner import RunOptions, format_metrics, format_table, make_tasks, run_tasks
+
+
+def parse_budget(text: str) -> tuple[profiling.ProfileSpec, Budget]:
+    # "day-N[:ptP[:input]]=LIMITS"
+    (spec, sep, limits) = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"invalid budget {text!r}; expected day-N[:ptP[:input]]=LIMITS")
+    try:
+        return (profiling.ProfileSpec.parse(spec), Budget.parse(limits))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    specs = tuple(profiling.ProfileSpec.parse(s) for s in args.profile)
+    days = args.day
+    if specs and (days is None):
+        days = sorted({spec.day for spec in specs})
+    tasks = make_tasks(days, args.part, args.input)
+    options = RunOptions(
+        use_cache=not args.no_cache,
+        memoize=not args.no_memo,
+        combined=not args.separate,
+        trace_memory=args.memory is not None,
+        metrics=args.metrics is not None,
+        profile=specs,
+        profile_dir=args.profile_dir,
+        profile_top=args.profile_top,
+        budget=Budget(args.timeout, None if (args.max_memory is None) else args.max_memory * 2**20),
+        budgets=tuple(args.budget),
+    )
+    if specs:
+        tasks = [t for t in tasks if options.should_profile(t)]
+    t0 = time.perf_counter()
+    results = run_tasks(tasks, jobs=args.jobs, options=options)
+    wall_time = time.perf_counter() - t0
+    print(format_table(results))
+    for r in results:
+        if r.interrupted:
+            print(f"\n== {r.task.label}: {r.status}, {r.error}")
+        if r.profile is not None:
+            print(f"\n== {r.task.label}: {r.profile.pstats_path}, {r.profile.collapsed_path}")
+            print(r.profile.top.rstrip())
+    if args.metrics is not None:
+        from aoc import bench
+        counted = format_metrics(results)
+        print("\n" + (counted or "No solver counted anything"))
+        report = {
+            r.task.label: {
+                "status": r.status,
+                "load_time": r.load_time,
+                "solve_time": r.solve_time,
+                "combined": r.combined,
+                "metrics": r.metrics,
+            }
+            for r in results
+        }
+        bench.write_json(args.metrics, {"results": report})
+        print(f"\nWrote metrics report to {args.metrics}")
+    if args.import_times is not None:
+        from aoc import imports
+        for day in sorted({t.day for t in tasks}):
+            print("\n" + imports.measure(day).format(args.import_times))
+    if args.memory is not None:
+        from aoc import bench
+        report = {r.task.label: r.memory.to_dict() for r in results if r.memory is not None}
+        bench.write_json(args.memory, {"results": report})
+        print(f"\nWrote memory report to {args.memory}")
+    cpu_time = sum(r.total_time for r in results)
+    memoized = sum(r.memoized for r in results)
+    print(
+        f"\n{len(results)} tasks in {wall_time:.2f}s wall ({cpu_time:.2f}s summed over tasks"
+        + (f", {memoized} answers memoized)" if memoized else ")")
+    )
+    return 0 if all(r.status == "ok" for r in results) else 1
+
+
+# The batch and bench modules are imported by their commands, so `run` doesn't pay for their
+# imports (a process pool, statistics, ...) on every start
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    from aoc import batch
+    paths = batch.expand_inputs(args.inputs)
+    if not paths:
+        print(f"No input files match {' '.join(args.inputs)}", file=sys.stderr)
+        return 1
+    options = RunOptions(use_cache=not args.no_cache, memoize=not args.no_memo, metrics=args.metrics)
+    out = sys.stdout if (args.output == "-") else open(args.output, "w")
+    (num_ok, num_results) = (0, 0)
+    t0 = time.perf_counter()
+    try:
+        for r in batch.run_batch(args.day, paths, args.part, args.jobs, options):
+            out.write(batch.to_json(r) + "\n")
+            out.flush()
+            (num_ok, num_results) = (num_ok + (r.status == "ok"), num_results + 1)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    wall_time = time.perf_counter() - t0
+    print(f"{num_ok}/{num_results} ok over {len(paths)} inputs in {wall_time:.2f}s", file=sys.stderr)
+    return 0 if (num_ok == num_results) else 1
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    from aoc import bench
+    days = args.day or default_days()
+    output = args.output or bench.RESULTS_PATH
+    baseline_path = args.baseline or bench.BASELINE_PATH
+    current = bench.run_benchmarks(
+        days, args.input, args.warmup, args.repeats, use_cache=not args.no_cache, log=print)
+    bench.write_json(output, current)
+    print(f"\nWrote results to {output}")
+    if args.update_baseline:
+        baseline = bench.read_json(baseline_path) if baseline_path.exists() else {"results": {}}
+        baseline["meta"] = current["meta"]
+        baseline["results"].update(current["results"])
+        bench.write_json(baseline_path, baseline)
+        print(f"Updated baseline {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; nothing to compare against")
+        return 0
+    regressions = bench.compare(current, bench.read_json(baseline_path), args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r.key}: {r.baseline:.4f}s -> {r.current:.4f}s ({r.ratio:.2f}x)")
+    return 1 if regressions else 0
+
+
+def cmd_gen(args: argparse.Namespace) -> int:
+    for n in args.n:
+        if args.output == "-":
+            print(generators.generate(args.day, n, args.seed))
+            continue
+        path = generators.write(args.day, n, args.seed, None if (args.output is None) else Path(args.output))
+        print(path)
+    return 0
+
+
+def cmd_scaling(args: argparse.Namespace) -> int:
+    days = args.day or sorted(scaling.EXPECTED)
+    (results, disagreeing) = ([], [])
+    for day in days:
+        results += scaling.check_day(day, args.part, args.seed, args.repeats, args.scale, log=print)
+        if not scaling.check_parallel(day, args.seed, scale=args.scale, log=print):
+            disagreeing += [day]
+    failed = [r for r in results if not r.ok]
+    print(f"\n{len(results) - len(failed)}/{len(results)} solvers scale as expected")
+    if disagreeing:
+        print(f"solve_parallel() disagrees with solve() for day(s) {', '.join(map(str, disagreeing))}")
+    return 1 if (failed or disagreeing) else 0
+
+
+def cmd_native(args: argparse.Namespace) -> int:
+    from aoc import native
+    results = native.compare_day(
+        args.day, args.n, args.variant, args.seed, args.repeats, args.cmake_preset, args.jobs, log=print)
+    for r in results:
+        if r.status == "unavailable":
+            print(f"\n== {r.variant} unavailable: {r.error}")
+            break
+    return 0 if all(r.status in ("ok", "unavailable") for r in results) else 1
+
+
+def cmd_cache(args: argparse.Namespace) -> int:
+    cache.clear()
+    answers.clear()
+    print(f"Removed {cache.CACHE_DIR} and {answers.ANSWERS_PATH}")
+    return 0
+
+
+def add_selection_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-d", "--day", type=int, nargs="+", help="days to run (default: all)")
+    parser.add_argument("-p", "--part", type=int, nargs="+", choices=PARTS, default=list(PARTS))
+    parser.add_argument("-i", "--input", nargs="+", default=list(INPUTS), help="input names")
+
+
+def add_cache_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--no-cache", action="store_true", help="always re-parse inputs")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m aoc", description="Advent of Code 2022 tooling")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="run solvers in parallel and print a result table")
+    add_selection_args(run)
+    run.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: #cpus)")
+    add_cache_args(run)
+    run.add_argument(
+        "--no-memo", action="store_true",
+        help="always run the solvers instead of reusing stored answers (e.g. when timing)")
+    run.add_argument(
+        "--separate", action="store_true",
+        help="run each part through its own solve_ptN instead of the combined solve()")
+    run.add_argument(
+        "--memory", type=Path, nargs="?", const=Path("memory.json"), default=None, metavar="REPORT",
+        help="trace solver allocations with tracemalloc and write a JSON report (default: memory.json)")
+    run.add_argument(
+        "--metrics", type=Path, nargs="?", const=Path("metrics.json"), default=None, metavar="REPORT",
+        help="collect the solvers' work counters and write them with the timings (default: metrics.json)")
+    run.add_argument(
+        "--profile", nargs="+", default=[], metavar="SPEC",
+        help="run the matching solvers under cProfile, e.g. day-12:pt2 or day-7:pt1:test")
+    run.add_argument("--profile-dir", type=Path, default=profiling.PROFILE_DIR)
+    run.add_argument("--profile-top", type=int, default=20, help="hot functions to print")
+    run.add_argument(
+        "--timeout", type=float, default=None, metavar="SECONDS",
+        help="stop any task (or combined pair of parts) running longer than this")
+    run.add_argument(
+        "--max-memory", type=int, default=None, metavar="MIB",
+        help="stop any task whose worker's resident memory goes over this (Linux only)")
+    run.add_argument(
+        "--budget", type=parse_budget, nargs="+", default=[], metavar="SPEC=LIMITS",
+        help="per day/part budgets overriding the defaults, e.g. day-18:pt2=5m day-15=30s,2GiB")
+    run.add_argument(
+        "--import-times", type=int, nargs="?", const=10, default=None, metavar="TOP",
+        help="after the run, import each day in a fresh interpreter and show its slowest imports")
+    run.set_defaults(func=cmd_run)
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="run one day over many input files and stream results as JSON lines")
+    batch_parser.add_argument("day", type=int)
+    batch_parser.add_argument("inputs", nargs="+", help="input files, directories or globs")
+    batch_parser.add_argument("-p", "--part", type=int, nargs="+", choices=PARTS, default=list(PARTS))
+    batch_parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes")
+    batch_parser.add_argument("-o", "--output", default="-", help="JSON lines file, or - for stdout")
+    add_cache_args(batch_parser)
+    batch_parser.add_argument("--no-memo", action="store_true", help="always run the solvers")
+    batch_parser.add_argument(
+        "--metrics", action="store_true", help="include the solvers' work counters in each result")
+    batch_parser.set_defaults(func=cmd_batch)
+
+    bench_parser = subparsers.add_parser("bench", help="time load/pt1/pt2/both and compare to a baseline")
+    bench_parser.add_argument("-d", "--day", type=int, nargs="+", help="days to run (default: all)")
+    bench_parser.add_argument("-i", "--input", nargs="+", default=["test"], help="input names")
+    bench_parser.add_argument("-w", "--warmup", type=int, default=1)
+    bench_parser.add_argument("-r", "--repeats", type=int, default=5)
+    bench_parser.add_argument(
+        "-o", "--output", type=Path, default=None, help="results file (default: benchmarks/latest.json)")
+    bench_parser.add_argument(
+        "--baseline", type=Path, default=None,
+        help="baseline to compare against (default: benchmarks/baseline.json)")
+    bench_parser.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="fail if a median is this fraction slower than the baseline (default: 0.25)")
+    bench_parser.add_argument(
+        "--update-baseline", action="store_true", help="merge these results into the baseline")
+    add_cache_args(bench_parser)
+    bench_parser.set_defaults(func=cmd_bench)
+
+    gen = subparsers.add_parser("gen", help="write seeded synthetic inputs of a given size")
+    gen.add_argument("day", type=int, choices=generators.DAYS)
+    gen.add_argument("n", type=int, nargs="+", help="input size(s); see aoc/generators/day_N.py")
+    gen.add_argument("-s", "--seed", type=int, default=0)
+    gen.add_argument(
+        "-o", "--output", default=None,
+        help="output file, or - for stdout (default: .cache/generated/day-N/n<N>-s<seed>.dat)")
+    gen.set_defaults(func=cmd_gen)
+
+    scaling_parser = subparsers.add_parser(
+        "scaling", help="fit each solver's growth exponent on generated inputs and flag super-linear days")
+    scaling_parser.add_argument(
+        "-d", "--day", type=int, nargs="+", choices=sorted(scaling.EXPECTED),
+        help="days to check (default: all with an expectation)")
+    scaling_parser.add_argument("-p", "--part", type=int, nargs="+", choices=PARTS, default=list(PARTS))
+    scaling_parser.add_argument(
+        "-r", "--repeats", type=int, default=3, help="best of this many runs per size")
+    scaling_parser.add_argument("-s", "--seed", type=int, default=0)
+    scaling_parser.add_argument(
+        "--scale", type=float, default=1.0,
+        help="multiply every input size by this (e.g. 0.25 for a quick run)")
+    scaling_parser.set_defaults(func=cmd_scaling)
+
+    native_parser = subparsers.add_parser(
+        "native", help="run a day's Python, C++ and Rust solutions on the same generated inputs")
+    native_parser.add_argument("day", type=int)
+    native_parser.add_argument(
+        "-n", type=int, nargs="+", default=[100, 10_000, 1_000_000],
+        help="generated input sizes (day 1: elves, ~48 bytes each; default: 100 10000 1000000)")
+    native_parser.add_argument(
+        "-v", "--variant", nargs="+", default=None, choices=["python", "cpp", "rust"],
+        help="implementations to run (default: all the day has)")
+    native_parser.add_argument(
+        "-r", "--repeats", type=int, default=1, help="best of this many runs per input")
+    native_parser.add_argument("-s", "--seed", type=int, default=0)
+    native_parser.add_argument(
+        "--cmake-preset", default="opt",
+        help="configure preset for the C++ build (opt-make where Ninja or clang is missing)")
+    native_parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="run the Python variant through the day's solve_parallel() on this many processes")
+    native_parser.set_defaults(func=cmd_native)
+
+    cache_parser = subparsers.add_parser("clear-cache", help="delete cached parsed inputs and stored answers")
+    cache_parser.set_defaults(func=cmd_cache)
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
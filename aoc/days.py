@@ -0,0 +1,144 @@
+import importlib.util
+import math
+import re
+import sys
+from dataclasses import dataclass
+from functools import cache, partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+
+ROOT = Path(__file__).resolve().parent.parent
+PARTS = (1, 2)
+INPUTS = ("example", "test")
+
+# Days whose solvers don't terminate yet; only run when asked for explicitly
+UNFINISHED = {19}
+
+# Inputs that don't follow the data/<name>.dat convention, keyed by (input name, part)
+INPUT_OVERRIDES = {
+    9: {("example", 1): "example_pt1.dat", ("example", 2): "example_pt2.dat"},
+}
+
+Thunk = Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class Day:
+    number: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return f"day-{self.number}"
+
+    @property
+    def data_dir(self) -> Path:
+        return self.path.parent.parent / "data"
+
+    def input_path(self, name: str, part: int) -> Path:
+        if name.endswith(".dat") or ("/" in name):  # an explicit file, e.g. a generated input
+            return Path(name)
+        fname = INPUT_OVERRIDES.get(self.number, {}).get((name, part), f"{name}.dat")
+        return self.data_dir / fname
+
+    def shares_input(self, name: str) -> bool:
+        return self.input_path(name, 1) == self.input_path(name, 2)
+
+    def load_module(self) -> ModuleType:
+        return load_module(self.path)
+
+    def bind(self, module: ModuleType, part: Optional[int], name: str, data: Any) -> Thunk:
+        # Wrap the solver call the same way the day's main() would make it. Part None binds the
+        # combined solve(), whose thunk returns (pt1, pt2).
+        return BINDERS.get(self.number, _bind_default)(module, part, name, data)
+
+
+@cache
+def load_module(path: Path) -> ModuleType:
+    module_name = path.parent.parent.name.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module  # so objects from load() can be pickled
+    spec.loader.exec_module(module)
+    return module
+
+
+def discover(root: Path = ROOT) -> list[Day]:
+    days = []
+    for path in root.glob("day-*/python/run.py"):
+        match = re.fullmatch(r"day-(\d+)", path.parent.parent.name)
+        if match is not None:
+            days += [Day(int(match.group(1)), path)]
+    return sorted(days, key=lambda d: d.number)
+
+
+def default_days() -> list[int]:
+    return [d.number for d in discover() if d.number not in UNFINISHED]
+
+
+def get_day(number: int, root: Path = ROOT) -> Day:
+    path = root / f"day-{number}" / "python" / "run.py"
+    if not path.exists():
+        raise ValueError(f"No solution found for day {number} (expected {path})")
+    return Day(number, path)
+
+
+def solver(module: ModuleType, part: Optional[int]) -> Callable:
+    return getattr(module, "solve" if (part is None) else f"solve_pt{part}")
+
+
+def has_combined_solver(module: ModuleType) -> bool:
+    return callable(getattr(module, "solve", None))
+
+
+def _bind_default(module: ModuleType, part: Optional[int], name: str, data: Any) -> Thunk:
+    args = data if isinstance(data, tuple) else (data,)
+    return partial(solver(module, part), *args)
+
+
+def _bind_day6(module: ModuleType, part: Optional[int], name: str, data: str) -> Thunk:
+    lines = data.split("\n")
+    if len(lines) == 1:
+        return partial(solver(module, part), data)
+    if part is None:
+        return lambda: tuple(map(list, zip(*[module.solve(line) for line in lines])))
+    return lambda: [solver(module, part)(line) for line in lines]  # example has one stream per line
+
+
+def _bind_day7(module: ModuleType, part: Optional[int], name: str, data: str) -> Thunk:
+    return partial(solver(module, part), module.parse(data.split("\n")))
+
+
+def _bind_day12(module: ModuleType, part: Optional[int], name: str, data: tuple) -> Thunk:
+    (hmap, start, end) = data
+    if part == 2:
+        return partial(module.solve_pt2, hmap, end)
+    return partial(solver(module, part), hmap, start, end)
+
+
+def _bind_day15(module: ModuleType, part: Optional[int], name: str, data: list) -> Thunk:
+    if part == 2:
+        return partial(module.solve_pt2, data)
+    return partial(solver(module, part), data, y=10 if (name == "example") else 2_000_000)
+
+
+def _bind_day22(module: ModuleType, part: Optional[int], name: str, data: tuple) -> Thunk:
+    (board, moves) = data
+    if part == 1:
+        return partial(module.solve_pt1, board, moves)
+    # Six faces tell us the side length; the example's net is three faces tall, the input's four
+    side_length = math.isqrt(sum(c != " " for row in board for c in row) // 6)
+    if len(board) == 3 * side_length:
+        return partial(solver(module, part), board, moves, module.EXAMPLE_CONNECTIVITY, side_length)
+    return partial(solver(module, part), board, moves, module.TEST_CONNECTIVITY, side_length)
+
+
+BINDERS = {
+    6: _bind_day6,
+    7: _bind_day7,
+    12: _bind_day12,
+    15: _bind_day15,
+    22: _bind_day22,
+}
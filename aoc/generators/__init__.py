@@ -0,0 +1,40 @@
+"""Seeded generators for scaled-up puzzle inputs, one module per day.
+
+Each module exposes `generate(n, rng) -> str`, returning text in the same format the day's
+`load()` parses. What `n` counts (lines, elves, grid side, ...) is documented per module.
+"""
+
+import importlib
+import random
+from pathlib import Path
+from typing import Optional
+
+from aoc.days import ROOT
+
+
+GENERATED_DIR = ROOT / ".cache" / "generated"
+DAYS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 17, 18, 19, 20, 21, 22)
+
+
+def generate(day: int, n: int, seed: int = 0) -> str:
+    if day not in DAYS:
+        raise ValueError(f"No input generator for day {day}")
+    module = importlib.import_module(f"aoc.generators.day_{day}")
+    return module.generate(n, random.Random(f"day-{day}:{n}:{seed}"))
+
+
+def default_path(day: int, n: int, seed: int = 0) -> Path:
+    return GENERATED_DIR / f"day-{day}" / f"n{n}-s{seed}.dat"
+
+
+def write(day: int, n: int, seed: int = 0, path: Optional[Path] = None) -> Path:
+    if path is None:
+        path = default_path(day, n, seed)
+        if path.exists():  # generation is deterministic, so reuse earlier output
+            return path
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    text = generate(day, n, seed)
+    with open(path, "w") as f:
+        f.write(text)
+    return path
@@ -0,0 +1,10 @@
+"""Calorie lists: `n` elves, each carrying 1-15 snacks."""
+
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    groups = []
+    for _ in range(max(n, 4)):  # part 2 needs more than three elves
+        groups += ["\n".join(str(rng.randint(1_000, 70_000)) for _ in range(rng.randint(1, 15)))]
+    return "\n\n".join(groups)
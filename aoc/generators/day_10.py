@@ -0,0 +1,10 @@
+"""CPU programs: `n` instructions (at least the 240 cycles the screen needs)."""
+
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(max(n, 240)):
+        lines += ["noop" if (rng.random() < 0.3) else f"addx {rng.randint(-10, 10)}"]
+    return "\n".join(lines)
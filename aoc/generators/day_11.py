@@ -0,0 +1,31 @@
+"""Monkey notes: eight monkeys holding `n` items between them.
+
+Squaring operations are left out; without the part 2 modulus they make worry levels grow
+doubly exponentially when the same item keeps landing on that monkey.
+"""
+
+import random
+
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23]
+N_MONKEY = 8
+
+
+def generate(n: int, rng: random.Random) -> str:
+    items = [[rng.randint(50, 99)] for _ in range(N_MONKEY)]  # every monkey needs an item
+    for _ in range(max(n - N_MONKEY, 0)):
+        items[rng.randrange(N_MONKEY)] += [rng.randint(50, 99)]
+    divisors = rng.sample(PRIMES, N_MONKEY)
+    monkeys = []
+    for i in range(N_MONKEY):
+        op = rng.choice(["*", "+"])
+        (if_true, if_false) = rng.sample([j for j in range(N_MONKEY) if j != i], 2)
+        monkeys += ["\n".join([
+            f"Monkey {i}:",
+            f"  Starting items: {', '.join(map(str, items[i]))}",
+            f"  Operation: new = old {op} {rng.randint(2, 19) if (op == '*') else rng.randint(1, 8)}",
+            f"  Test: divisible by {divisors[i]}",
+            f"    If true: throw to monkey {if_true}",
+            f"    If false: throw to monkey {if_false}",
+        ])]
+    return "\n\n".join(monkeys)
@@ -0,0 +1,17 @@
+"""Heightmaps: an `n` x `4n` grid with a climbable path from S to E along its border."""
+
+import random
+import string
+
+
+def generate(n: int, rng: random.Random) -> str:
+    (n_row, n_col) = (max(n, 2), max(4 * n, 26))
+    grid = [rng.choices(string.ascii_lowercase, k=n_col) for _ in range(n_row)]
+    # Walk along the top row and down the last column, climbing at most one step at a time
+    path = [(0, j) for j in range(n_col)] + [(i, n_col - 1) for i in range(1, n_row)]
+    for (k, (i, j)) in enumerate(path):
+        grid[i][j] = string.ascii_lowercase[(25 * k) // (len(path) - 1)]
+    grid[0][0] = "S"
+    (i_end, j_end) = path[-1]
+    grid[i_end][j_end] = "E"
+    return "\n".join("".join(row) for row in grid)
@@ -0,0 +1,21 @@
+"""Distress signal packets: `n` pairs of randomly nested lists."""
+
+import random
+
+
+def packet(rng: random.Random, depth: int = 0) -> list:
+    items = []
+    for _ in range(rng.randint(0, 5)):
+        if (depth < 4) and (rng.random() < 0.3):
+            items += [packet(rng, depth + 1)]
+        else:
+            items += [rng.randint(0, 10)]
+    return items
+
+
+def generate(n: int, rng: random.Random) -> str:
+    pairs = []
+    for _ in range(n):
+        (left, right) = (packet(rng), packet(rng))
+        pairs += [f"{left}\n{right}".replace(" ", "")]
+    return "\n\n".join(pairs)
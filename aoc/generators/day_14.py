@@ -0,0 +1,26 @@
+"""Cave scans: `n` rock paths below the sand source at x = 500."""
+
+import random
+
+
+def rock_path(rng: random.Random, x: int, y: int, depth: int) -> list[tuple[int, int]]:
+    points = [(x, y)]
+    horizontal = rng.random() < 0.5
+    for _ in range(rng.randint(1, 5)):
+        step = rng.randint(1, 6) * rng.choice([-1, 1])
+        (x, y) = (x + step, y) if horizontal else (x, min(max(y + step, 1), depth))
+        if (x, y) != points[-1]:
+            points += [(x, y)]
+        horizontal = not horizontal
+    return points
+
+
+def generate(n: int, rng: random.Random) -> str:
+    (depth, half_width) = (max(n, 10), max(n // 4, 5))
+    # Pin a path on either side of the source so the map always covers x = 500
+    paths = [[(500 - half_width, depth), (500 - half_width, depth - 1)],
+             [(500 + half_width, depth), (500 + half_width, depth - 1)]]
+    for _ in range(max(n - 2, 0)):
+        x = rng.randint(500 - half_width, 500 + half_width)
+        paths += [rock_path(rng, x, rng.randint(1, depth), depth)]
+    return "\n".join(" -> ".join(f"{x},{y}" for (x, y) in p) for p in paths if len(p) > 1)
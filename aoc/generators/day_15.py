@@ -0,0 +1,27 @@
+"""Sensor reports: `n` sensors scattered over [0, 4_000_000]^2.
+
+A hidden point is chosen first and every sensor's range stops short of it, so part 2 always has
+somewhere to find.
+"""
+
+import math
+import random
+
+
+SPAN = 4_000_000
+
+
+def generate(n: int, rng: random.Random) -> str:
+    hidden = (rng.randint(0, SPAN), rng.randint(0, SPAN))
+    max_radius = SPAN // max(math.isqrt(n), 1)
+    lines = []
+    while len(lines) < n:
+        (x, y) = (rng.randint(0, SPAN), rng.randint(0, SPAN))
+        dist = abs(x - hidden[0]) + abs(y - hidden[1])
+        if dist < 2:
+            continue
+        r = rng.randint(1, min(dist - 1, max_radius))
+        dx = rng.randint(-r, r)
+        dy = (r - abs(dx)) * rng.choice([-1, 1])
+        lines += [f"Sensor at x={x}, y={y}: closest beacon is at x={x + dx}, y={y + dy}"]
+    return "\n".join(lines)
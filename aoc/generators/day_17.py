@@ -0,0 +1,7 @@
+"""Jet patterns: `n` random pushes."""
+
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    return "".join(rng.choices("<>", k=n))
@@ -0,0 +1,10 @@
+"""Lava droplets: `n` distinct unit cubes packed into a box at roughly 35% density."""
+
+import math
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    side = math.ceil((n / 0.35) ** (1 / 3))
+    cells = rng.sample(range(side ** 3), min(n, side ** 3))
+    return "\n".join(f"{c // (side * side)},{(c // side) % side},{c % side}" for c in cells)
@@ -0,0 +1,16 @@
+"""Robot blueprints: `n` blueprints with puzzle-sized robot costs."""
+
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    lines = []
+    for i in range(1, n + 1):
+        lines += [
+            f"Blueprint {i}: "
+            f"Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} obsidian."
+        ]
+    return "\n".join(lines)
@@ -0,0 +1,7 @@
+"""Strategy guides: `n` rounds of "<A|B|C> <X|Y|Z>"."""
+
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    return "\n".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(n))
@@ -0,0 +1,9 @@
+"""Encrypted files: `n` numbers, exactly one of which is zero."""
+
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    values = [rng.choice([-1, 1]) * rng.randint(1, 10_000) for _ in range(max(n - 1, 1))]
+    values.insert(rng.randint(0, len(values)), 0)
+    return "\n".join(map(str, values))
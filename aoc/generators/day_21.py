@@ -0,0 +1,86 @@
+"""Monkey riddles: an expression tree of about `n` monkeys with a single "humn" leaf.
+
+Values are built top-down so every division is exact, and root's operands are equal, which
+makes humn's own number the answer to part 2. "humn" never sits in a divisor, so the part 2
+equation stays linear.
+"""
+
+import random
+import re
+import string
+
+
+MAX_VALUE = 2 ** 50  # keeps intermediate true divisions exact as floats
+
+
+def small_factor(value: int, rng: random.Random) -> int:
+    factors = [f for f in range(2, 12) if value % f == 0]
+    return rng.choice(factors) if factors else 0
+
+
+def expression(value: int, size: int, rng: random.Random) -> tuple:
+    # Returns a nested (op, left, right) tree, or a leaf value, evaluating to `value`
+    if (size <= 1) or (value < 2):
+        return value
+    ops = ["+", "-"]
+    if small_factor(value, rng):
+        ops += ["*"]
+    if value * 11 < MAX_VALUE:
+        ops += ["/"]
+    op = rng.choice(ops)
+    if op == "+":
+        a = rng.randint(1, value - 1)
+        (left, right) = (a, value - a)
+    elif op == "-":
+        b = rng.randint(1, max(value // 2, 1))
+        (left, right) = (value + b, b)
+    elif op == "*":
+        b = small_factor(value, rng)
+        (left, right) = (value // b, b)
+    else:
+        b = rng.randint(2, 11)
+        (left, right) = (value * b, b)
+    n_left = max(1, int((size - 1) * rng.uniform(0.25, 0.75)))
+    n_right = max(1, size - 1 - n_left)
+    return (op, expression(left, n_left, rng), expression(right, n_right, rng))
+
+
+def generate(n: int, rng: random.Random) -> str:
+    value = rng.randint(10 ** 6, 10 ** 9)
+    n_side = max((n - 1) // 2, 1)
+    sides = [expression(value, n_side, rng), expression(value, n_side, rng)]
+
+    used = {"root", "humn"}
+
+    def new_name() -> str:
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase, k=4))
+            if name not in used:
+                used.add(name)
+                return name
+
+    lines = []
+    humn_candidates = []
+
+    def emit(node, name: str, humn_ok: bool) -> None:
+        if not isinstance(node, tuple):
+            lines.append(f"{name}: {node}")
+            if humn_ok:
+                humn_candidates.append(name)
+            return
+        (op, left, right) = node
+        (n1, n2) = (new_name(), new_name())
+        lines.append(f"{name}: {n1} {op} {n2}")
+        emit(left, n1, humn_ok)
+        emit(right, n2, humn_ok and (op != "/"))
+
+    (n1, n2) = (new_name(), new_name())
+    lines.append(f"root: {n1} + {n2}")
+    emit(sides[0], n1, True)
+    emit(sides[1], n2, False)
+
+    # Rename one leaf on the left-hand side (and the reference to it) to humn
+    old = rng.choice(humn_candidates)
+    lines = [re.sub(rf"\b{old}\b", "humn", line) for line in lines]
+    rng.shuffle(lines)
+    return "\n".join(lines)
@@ -0,0 +1,23 @@
+"""Monkey maps: a cube net with faces of side `n`, laid out like the puzzle input, and `40n` moves."""
+
+import random
+
+
+# (face row, face column) of each face in the net, in the same order as TEST_CONNECTIVITY
+LAYOUT = [(0, 1), (0, 2), (1, 1), (2, 0), (2, 1), (3, 0)]
+
+
+def generate(n: int, rng: random.Random, wall_density: float = 0.1) -> str:
+    side = max(n, 2)
+    rows = [[" "] * (3 * side) for _ in range(4 * side)]
+    for (fi, fj) in LAYOUT:
+        for i in range(fi * side, (fi + 1) * side):
+            for j in range(fj * side, (fj + 1) * side):
+                rows[i][j] = "#" if (rng.random() < wall_density) else "."
+    rows[0][side] = "."  # starting tile
+    board = "\n".join("".join(row).rstrip() for row in rows)
+
+    moves = [str(rng.randint(1, 2 * side))]
+    for _ in range(40 * side):
+        moves += [rng.choice("LR"), str(rng.randint(1, 2 * side))]
+    return board + "\n\n" + "".join(moves)
@@ -0,0 +1,34 @@
+"""Rucksacks: `n` lines (rounded up to a multiple of 3).
+
+Each rucksack's compartments share exactly one item and each group of three shares exactly one
+badge, which is what both parts assume.
+"""
+
+import random
+import string
+
+
+ITEMS = string.ascii_lowercase + string.ascii_uppercase
+
+
+def fill(required: list[str], pool: list[str], size: int, rng: random.Random) -> list[str]:
+    items = required + rng.choices(required + pool, k=size - len(required))
+    rng.shuffle(items)
+    return items
+
+
+def generate(n: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range((n + 2) // 3):
+        items = list(ITEMS)
+        rng.shuffle(items)
+        (badge, rest) = (items[0], items[1:])
+        for k in range(3):
+            # Each elf draws from a private pool so the badge is the only item all three share
+            (shared, *pool) = rest[17 * k:17 * (k + 1)]
+            (left_pool, right_pool) = (pool[:8], pool[8:])
+            size = rng.randint(3, 16)
+            left = fill([shared, badge], left_pool, size, rng)
+            right = fill([shared], right_pool, size, rng)
+            lines += ["".join(left + right)]
+    return "\n".join(lines)
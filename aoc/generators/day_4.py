@@ -0,0 +1,12 @@
+"""Section assignments: `n` pairs of ranges within sections 1..`width`."""
+
+import random
+
+
+def section_range(width: int, rng: random.Random) -> str:
+    (a, b) = sorted((rng.randint(1, width), rng.randint(1, width)))
+    return f"{a}-{b}"
+
+
+def generate(n: int, rng: random.Random, width: int = 99) -> str:
+    return "\n".join(f"{section_range(width, rng)},{section_range(width, rng)}" for _ in range(n))
@@ -0,0 +1,28 @@
+"""Crate stacks: nine stacks of up to `height` crates followed by `n` valid moves."""
+
+import random
+import string
+
+
+N_STACK = 9  # stack labels are single digits in the diagram
+
+
+def generate(n: int, rng: random.Random, height: int = 8) -> str:
+    stacks = [rng.choices(string.ascii_uppercase, k=rng.randint(1, height)) for _ in range(N_STACK)]
+    tallest = max(len(s) for s in stacks)
+    diagram = []
+    for level in reversed(range(tallest)):
+        cells = [f"[{s[level]}]" if (level < len(s)) else "   " for s in stacks]
+        diagram += [" ".join(cells)]
+    diagram += [" ".join(f" {i + 1} " for i in range(N_STACK))]
+
+    # Both cranes leave the same number of crates on each stack, so tracking heights is enough
+    heights = [len(s) for s in stacks]
+    moves = []
+    for _ in range(n):
+        start = rng.choice([i for (i, h) in enumerate(heights) if h > 0])
+        end = rng.choice([i for i in range(N_STACK) if i != start])
+        num = rng.randint(1, min(heights[start], 5))
+        (heights[start], heights[end]) = (heights[start] - num, heights[end] + num)
+        moves += [f"move {num} from {start + 1} to {end + 1}"]
+    return "\n".join(diagram) + "\n\n" + "\n".join(moves)
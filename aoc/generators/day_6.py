@@ -0,0 +1,11 @@
+"""Datastreams: `n` characters with both markers at the very end, so a full scan is needed."""
+
+import random
+import string
+
+
+def generate(n: int, rng: random.Random) -> str:
+    # Three letters can never form a 4-character marker; the tail then has 14 distinct letters
+    noise = "".join(rng.choices("abc", k=max(n - 14, 0)))
+    tail = "".join(rng.sample(string.ascii_lowercase, 14))
+    return noise + tail
@@ -0,0 +1,44 @@
+"""Terminal logs: a random filesystem with `n` files and roughly `n // 4` directories."""
+
+import random
+import string
+
+
+def name(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+
+
+def generate(n: int, rng: random.Random) -> str:
+    # Each directory is a (dirs, files) pair of dicts keyed by name
+    root = ({}, {})
+    dirs = [root]
+    for _ in range(max(n // 4, 1)):
+        parent = rng.choice(dirs)
+        child = ({}, {})
+        parent[0][f"{name(rng)}{len(dirs)}"] = child
+        dirs += [child]
+    # The puzzle's disk holds 70,000,000 and part 2 frees space until 30,000,000 are unused, so the
+    # files are scaled to fill between 41M and 69M of it whatever `n` is: part 2 then always has to
+    # delete something and can. Rounding keeps the total within `n` of the target.
+    weights = [rng.randint(1, 300_000) for _ in range(n)]
+    (total, weight_sum) = (rng.randint(41_000_000, 69_000_000), sum(weights))
+    for (i, weight) in enumerate(weights):
+        size = max(weight * total // weight_sum, 1)
+        rng.choice(dirs)[1][f"{name(rng)}{i}.{rng.choice(['txt', 'dat', 'log'])}"] = size
+
+    lines = ["$ cd /"]
+    stack = [("/", root, False)]
+    while stack:
+        (dir_name, (subdirs, files), visited) = stack.pop()
+        if visited:
+            lines += ["$ cd .."]
+            continue
+        if dir_name != "/":
+            lines += [f"$ cd {dir_name}"]
+            stack += [(dir_name, (subdirs, files), True)]
+        lines += ["$ ls"]
+        lines += [f"dir {d}" for d in subdirs] + [f"{size} {f}" for (f, size) in files.items()]
+        stack += [(d, contents, False) for (d, contents) in reversed(subdirs.items())]
+    while lines[-1] == "$ cd ..":
+        lines.pop()
+    return "\n".join(lines)
@@ -0,0 +1,7 @@
+"""Tree heights: an `n` x `n` grid of digits."""
+
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    return "\n".join("".join(rng.choices("0123456789", k=n)) for _ in range(n))
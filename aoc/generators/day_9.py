@@ -0,0 +1,7 @@
+"""Rope motions: `n` moves of 1-20 steps each."""
+
+import random
+
+
+def generate(n: int, rng: random.Random) -> str:
+    return "\n".join(f"{rng.choice('LRUD')} {rng.randint(1, 20)}" for _ in range(n))
@@ -0,0 +1,176 @@
+"""Vectorised helpers for the grid puzzles (days 8, 12, 14, 17, 18 and 22).
+
+Everything works on 2D or 3D arrays. Offsets are tuples with one entry per axis, and an edge mask
+for offset `o` says whether a step from each cell `p` to `p + o` is allowed.
+"""
+
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from aoc import metrics
+
+
+Offset = tuple[int, ...]
+
+OFFSETS_2D: tuple[Offset, ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+OFFSETS_3D: tuple[Offset, ...] = (
+    (-1, 0, 0), (1, 0, 0), (0, -1, 0), (0, 1, 0), (0, 0, -1), (0, 0, 1),
+)
+
+THIN_FRONTIER = 32  # bfs_distances() expands frontiers up to this many cells in Python
+
+
+def offsets(ndim: int) -> tuple[Offset, ...]:
+    return {2: OFFSETS_2D, 3: OFFSETS_3D}[ndim]
+
+
+def shift(a: np.ndarray, offset: Offset, fill=0) -> np.ndarray:
+    # result[p] = a[p - offset]; cells shifted in from outside the array get `fill`
+    out = np.full_like(a, fill)
+    (src, dst) = ([], [])
+    for (n, o) in zip(a.shape, offset):
+        o = max(min(o, n), -n)
+        src += [slice(max(-o, 0), n - max(o, 0))]
+        dst += [slice(max(o, 0), n - max(-o, 0))]
+    out[tuple(dst)] = a[tuple(src)]
+    return out
+
+
+def neighbour(a: np.ndarray, offset: Offset, fill=0) -> np.ndarray:
+    # result[p] = a[p + offset]
+    return shift(a, tuple(-o for o in offset), fill)
+
+
+def pad_mask(mask: np.ndarray, width=1, value: bool = False) -> np.ndarray:
+    return np.pad(mask.astype(bool), width, constant_values=value)
+
+
+def grow(a: np.ndarray, size: int, axis: int = 0) -> np.ndarray:
+    # Zero-pads `a` along `axis` to at least `size`, doubling so repeated growth is amortised O(1)
+    if a.shape[axis] >= size:
+        return a
+    width = [(0, 0)] * a.ndim
+    width[axis] = (0, max(size, 2 * a.shape[axis]) - a.shape[axis])
+    return np.pad(a, width)
+
+
+def count_neighbours(mask: np.ndarray, offs: Optional[Sequence[Offset]] = None) -> np.ndarray:
+    offs = offsets(mask.ndim) if (offs is None) else offs
+    return sum(neighbour(mask, o, False).astype(int) for o in offs)
+
+
+def step_edges(
+    values: np.ndarray,
+    allowed: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    offs: Optional[Sequence[Offset]] = None,
+) -> list[np.ndarray]:
+    # Edge masks for steps within the array where allowed(value here, value there) holds
+    offs = offsets(values.ndim) if (offs is None) else offs
+    inside = np.ones(values.shape, dtype=bool)
+    edges = []
+    for o in offs:
+        edges += [neighbour(inside, o, False) & allowed(values, neighbour(values, o))]
+    return edges
+
+
+def bfs_distances(
+    sources: np.ndarray,
+    edges: Sequence[np.ndarray],
+    offs: Optional[Sequence[Offset]] = None,
+) -> np.ndarray:
+    # Multi-source BFS a layer at a time; unreachable cells get -1. The frontier is kept as flat
+    # cell indices and only those are stepped along the edges, so each cell is expanded once and a
+    # search costs O(cells) however many layers it takes. The edge masks already rule out steps
+    # off the array, so a step is just a fixed change of flat index.
+    offs = offsets(sources.ndim) if (offs is None) else offs
+    strides = [int(np.prod(sources.shape[axis + 1:])) for axis in range(sources.ndim)]
+    steps = [sum(o * stride for (o, stride) in zip(offset, strides)) for offset in offs]
+    edges = [e.ravel() for e in edges]
+    dist = np.full(sources.size, -1, dtype=np.int64)
+    frontier = np.flatnonzero(sources)
+    dist[frontier] = 0
+    d = 0
+    while len(frontier) > 0:
+        d += 1
+        if len(frontier) <= THIN_FRONTIER:
+            # numpy's per-call overhead would dominate a layer this small, e.g. along a corridor
+            reached = []
+            for p in frontier:
+                for (step, e) in zip(steps, edges):
+                    if e[p] and (dist[p + step] < 0):
+                        dist[p + step] = d
+                        reached += [p + step]
+            frontier = reached
+            continue
+        frontier = np.asarray(frontier, dtype=np.int64)
+        reached = np.concatenate([frontier[e[frontier]] + step for (step, e) in zip(steps, edges)])
+        frontier = np.unique(reached[dist[reached] < 0])
+        dist[frontier] = d
+    metrics.count("bfs_layers", d)
+    if metrics.enabled():
+        metrics.count("bfs_cells", int((dist >= 0).sum()))
+    return dist.reshape(sources.shape)
+
+
+def flood_fill(mask: np.ndarray, seeds: np.ndarray, offs: Optional[Sequence[Offset]] = None) -> np.ndarray:
+    offs = offsets(mask.ndim) if (offs is None) else offs
+    edges = [neighbour(mask, o, False) for o in offs]
+    return bfs_distances(seeds & mask, edges, offs) >= 0
+
+
+def label(mask: np.ndarray, offs: Optional[Sequence[Offset]] = None) -> tuple[np.ndarray, int]:
+    # Connected components as labels 0..n-1 (-1 outside the mask). Every cell repeatedly takes
+    # the smallest flat index among its neighbours, with pointer jumping to shorten the chains.
+    offs = offsets(mask.ndim) if (offs is None) else offs
+    big = mask.size
+    labels = np.where(mask, np.arange(mask.size).reshape(mask.shape), big)
+    while True:
+        new = labels
+        for o in offs:
+            new = np.minimum(new, np.where(mask, neighbour(labels, o, big), big))
+        flat = np.append(new.ravel(), big)
+        new = flat[new]
+        if np.array_equal(new, labels):
+            break
+        labels = new
+    (roots, dense) = np.unique(labels[mask], return_inverse=True)
+    out = np.full(mask.shape, -1, dtype=np.int64)
+    out[mask] = dense
+    return (out, len(roots))
+
+
+def next_index(mask: np.ndarray, axis: int = -1, reverse: bool = False) -> np.ndarray:
+    # For every cell, the index along `axis` of the next True cell strictly after it (strictly
+    # before it if `reverse`), or n (-1 if `reverse`) when there is none.
+    mask = np.moveaxis(mask, axis, -1)
+    n = mask.shape[-1]
+    idx = np.arange(n)
+    if reverse:
+        marks = np.where(mask, idx, -1)
+        out = shift(np.maximum.accumulate(marks, axis=-1), (0,) * (mask.ndim - 1) + (1,), -1)
+    else:
+        marks = np.where(mask, idx, n)
+        suffix_min = np.minimum.accumulate(marks[..., ::-1], axis=-1)[..., ::-1]
+        out = shift(suffix_min, (0,) * (mask.ndim - 1) + (-1,), n)
+    return np.moveaxis(out, -1, axis)
+
+
+def prefix_max(a: np.ndarray, axis: int = -1, reverse: bool = False, initial=-1) -> np.ndarray:
+    # Maximum of everything strictly before each cell along `axis` (strictly after if `reverse`)
+    a = np.moveaxis(a, axis, -1)
+    if reverse:
+        a = a[..., ::-1]
+    running = shift(np.maximum.accumulate(a, axis=-1), (0,) * (a.ndim - 1) + (1,), initial)
+    if reverse:
+        running = running[..., ::-1]
+    return np.moveaxis(running, -1, axis)
+
+
+def first_true(mask: np.ndarray, axis: int = -1) -> np.ndarray:
+    return np.where(mask.any(axis=axis), np.argmax(mask, axis=axis), -1)
+
+
+def last_true(mask: np.ndarray, axis: int = -1) -> np.ndarray:
+    n = mask.shape[axis]
+    return np.where(mask.any(axis=axis), n - 1 - np.argmax(np.flip(mask, axis=axis), axis=axis), -1)
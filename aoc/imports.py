@@ -0,0 +1,81 @@
+"""Per-module import times for each day, as reported by `python -X importtime`.
+
+Days are imported in a fresh interpreter that has only aoc.days loaded, the way a runner worker
+starts out, since in a long-lived worker anything another day already imported (numpy, say) would
+look free. Only the imports the day itself triggers are reported.
+"""
+
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+from aoc.days import ROOT
+
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+MARKER = "-- aoc.imports: day --"
+CODE = (
+    "import sys\n"
+    "from aoc.days import get_day\n"
+    f"print({MARKER!r}, file=sys.stderr, flush=True)\n"
+    "get_day({day}).load_module()\n"
+)
+
+
+@dataclass(frozen=True)
+class ModuleTime:
+    name: str
+    depth: int  # 0 for modules the day imports directly
+    self_time: float  # seconds
+    cumulative: float
+
+
+@dataclass
+class ImportReport:
+    day: int
+    wall_time: float  # the whole interpreter: startup, aoc.days and the day
+    modules: list[ModuleTime]
+
+    @property
+    def import_time(self) -> float:
+        return sum(m.cumulative for m in self.modules if m.depth == 0)
+
+    def format(self, top: int = 10) -> str:
+        lines = [
+            f"== day-{self.day}: imports {1e3 * self.import_time:.1f} ms "
+            f"(cold start {1e3 * self.wall_time:.1f} ms)"
+        ]
+        # Parents are never cheaper than their children, so the indentation still reads as a tree
+        heaviest = sorted(self.modules, key=lambda m: m.cumulative, reverse=True)[:top]
+        if heaviest:
+            width = max(len(m.name) + 2 * m.depth for m in heaviest)
+            lines += [f"{'module'.ljust(width)}  self (ms)  cumulative (ms)"]
+            for m in heaviest:
+                name = "  " * m.depth + m.name
+                lines += [f"{name.ljust(width)}  {1e3 * m.self_time:9.1f}  {1e3 * m.cumulative:15.1f}"]
+        return "\n".join(lines)
+
+
+def parse_importtime(stderr: str) -> list[ModuleTime]:
+    # The day's imports are the ones after the marker; the runner has already paid for the rest
+    (_, _, after) = stderr.partition(MARKER)
+    modules = []
+    for match in LINE.finditer(after):
+        (self_us, cumulative_us, indent, name) = match.groups()
+        depth = len(indent) // 2  # `-X importtime` indents two spaces per level
+        modules += [ModuleTime(name, depth, int(self_us) / 1e6, int(cumulative_us) / 1e6)]
+    return modules
+
+
+def measure(day: int) -> ImportReport:
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CODE.format(day=day)],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    wall_time = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing day {day} failed:\n{proc.stderr.strip()}")
+    return ImportReport(day, wall_time, parse_importtime(proc.stderr))
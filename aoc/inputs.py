@@ -0,0 +1,85 @@
+"""Streaming readers for puzzle inputs.
+
+These never hold more than a line or a chunk of the file as Python objects, so a day whose load() and
+solvers consume them can work through generated inputs far bigger than memory.
+"""
+
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Iterator, Union
+
+
+CHUNK_SIZE = 1 << 20
+INT_PATTERN = rb"-?\d+"
+
+PathLike = Union[str, Path]
+
+
+def lines(path: PathLike) -> Iterator[bytes]:
+    # Lines without their line endings, read through a memory map
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            for line in iter(m.readline, b""):
+                yield line.rstrip(b"\r\n")
+
+
+def text_lines(path: PathLike, encoding: str = "ascii") -> Iterator[str]:
+    return (line.decode(encoding) for line in lines(path))
+
+
+def chunks(path: PathLike, size: int = CHUNK_SIZE, delimiter: bytes = b"\n") -> Iterator[bytes]:
+    # Blocks of roughly `size` bytes that always end on a line boundary, so no line (or number in
+    # it) is ever split between two chunks. With delimiter=b"\n\n" they end on a blank line instead,
+    # keeping groups of lines whole.
+    with open(path, "rb") as f:
+        rest = b""
+        for block in iter(lambda: f.read(size), b""):
+            block = rest + block
+            end = block.rfind(delimiter)
+            cut = (end + len(delimiter)) if (end >= 0) else 0
+            (chunk, rest) = (block[:cut], block[cut:])
+            if chunk:
+                yield chunk
+        if rest:
+            yield rest
+
+
+def ranges(path: PathLike, size: int = CHUNK_SIZE, delimiter: bytes = b"\n") -> list[tuple[int, int]]:
+    # (start, end) byte offsets of blocks of about `size` bytes that end just past a delimiter, like
+    # chunks() but without reading the blocks in: the delimiters are found through a memory map, so
+    # the ranges can be handed to workers that each map the file themselves
+    with open(path, "rb") as f:
+        length = os.fstat(f.fileno()).st_size
+        if length == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            (bounds, start) = ([], 0)
+            while start < length:
+                found = m.find(delimiter, start + size)
+                end = (found + len(delimiter)) if (found >= 0) else length
+                bounds += [(start, end)]
+                start = end
+            return bounds
+
+
+def int_blocks(path: PathLike, pattern: bytes = INT_PATTERN, size: int = CHUNK_SIZE) -> Iterator:
+    # The integers of each chunk() as an int64 array, skipping chunks without any; a block always
+    # holds whole lines. Use pattern=rb"\d+" where '-' is a separator (e.g. "2-4,6-8") rather than a
+    # sign.
+    import numpy as np
+    regex = re.compile(pattern)
+    for chunk in chunks(path, size):
+        block = np.array(regex.findall(chunk)).astype(np.int64)
+        if block.size > 0:
+            yield block
+
+
+def ints(path: PathLike, pattern: bytes = INT_PATTERN, size: int = CHUNK_SIZE):
+    # Every integer in the file, in order, as one int64 array
+    import numpy as np
+    blocks = list(int_blocks(path, pattern, size))
+    return np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.int64)
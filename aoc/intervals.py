@@ -0,0 +1,57 @@
+"""Query index over closed integer intervals, e.g. day 4's section assignments.
+
+Built once, then answers repeated questions in logarithmic time instead of a scan per question:
+how many intervals contain a point (for one point or a whole array of them), how many overlap a
+range, and which ones. Counts come from binary searches over the sorted lower and upper bounds.
+Listing uses an interval tree: the intervals ordered by lower bound, under a binary tree holding
+the largest upper bound in each subtree, so only subtrees that can hold a match are descended.
+"""
+
+import numpy as np
+
+
+class IntervalIndex:
+    def __init__(self, lo: np.ndarray, hi: np.ndarray):
+        (lo, hi) = (np.asarray(lo, dtype=np.int64), np.asarray(hi, dtype=np.int64))
+        assert (lo.shape == hi.shape) and (lo.ndim == 1) and np.all(lo <= hi)
+        self.order = np.argsort(lo, kind="stable")  # tree leaf -> interval
+        self.starts = lo[self.order]
+        self.ends = np.sort(hi)
+        # levels[0] has the upper bounds in leaf order, padded to a power of two with intervals that
+        # match nothing; each level above halves the one below by taking pairwise maxima
+        size = 1 << max(len(lo) - 1, 0).bit_length()
+        self.levels = [np.full(size, np.iinfo(np.int64).min)]
+        self.levels[0][:len(lo)] = hi[self.order]
+        while len(self.levels[-1]) > 1:
+            below = self.levels[-1]
+            self.levels += [np.maximum(below[0::2], below[1::2])]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def count(self, x: int) -> int:
+        return int(self.counts(np.asarray(x)))
+
+    def counts(self, xs: np.ndarray) -> np.ndarray:
+        # For each point, the number of intervals containing it: those starting at or before it,
+        # less those that have already ended
+        return np.searchsorted(self.starts, xs, side="right") - np.searchsorted(self.ends, xs, side="left")
+
+    def count_overlapping(self, lo: int, hi: int) -> int:
+        assert lo <= hi
+        ended = np.searchsorted(self.ends, lo, side="left")
+        return int(np.searchsorted(self.starts, hi, side="right") - ended)
+
+    def overlapping(self, lo: int, hi: int) -> np.ndarray:
+        # Indices (into the arrays the index was built from) of the intervals overlapping [lo, hi],
+        # ascending. Only leaves before `stop` start early enough; of those, subtrees whose largest
+        # upper bound is below `lo` are skipped, so this is O((k + 1) log n) for k matches. The tree
+        # is descended a level at a time, with all the nodes still in the running in one array.
+        assert lo <= hi
+        stop = np.searchsorted(self.starts, hi, side="right")
+        nodes = np.zeros(1 if (len(self) > 0) else 0, dtype=np.int64)
+        for level in reversed(range(len(self.levels))):
+            nodes = nodes[((nodes << level) < stop) & (self.levels[level][nodes] >= lo)]
+            if level > 0:
+                nodes = np.stack((2 * nodes, 2 * nodes + 1), axis=1).ravel()
+        return np.sort(self.order[nodes])
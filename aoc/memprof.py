@@ -0,0 +1,98 @@
+import threading
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc.days import ROOT
+
+
+IGNORE = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+@dataclass
+class LineStat:
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    peak: int
+    retained: int
+    # Live blocks in the snapshot taken near the peak. tracemalloc only sees live blocks, so this is
+    # not a count of every allocation the solver made.
+    blocks_near_peak: int
+    top: list[LineStat] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class PeakSnapshotter(threading.Thread):
+    # Polls the traced size and keeps the largest snapshot it manages to take, stopping once the
+    # heap gets close to a known peak. Peaks reached inside a single C call (e.g. a big set
+    # union) can't be caught exactly, so intermediate snapshots are taken as the heap grows.
+    def __init__(self, peak: int, interval: float) -> None:
+        super().__init__(daemon=True)
+        self.peak = peak
+        self.interval = interval
+        self.snapshot = None
+        self.snapshot_size = 0
+        self.done = threading.Event()
+
+    def run(self) -> None:
+        while not self.done.wait(self.interval):
+            current = tracemalloc.get_traced_memory()[0]
+            if current >= max(1.25 * self.snapshot_size, 0.1 * self.peak):
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+                if current >= 0.8 * self.peak:
+                    return
+
+
+def relative_location(frame: tracemalloc.Frame) -> str:
+    path = Path(frame.filename)
+    if path.is_relative_to(ROOT):
+        path = path.relative_to(ROOT)
+    return f"{path}:{frame.lineno}"
+
+
+def trace(
+    prepare: Callable[[], Callable[[], Any]],
+    top_n: int = 10,
+    interval: float = 0.001,
+) -> tuple[Any, MemoryReport]:
+    # prepare() returns a fresh solver call each time, since it has to run twice: snapshots are
+    # themselves traced and slow on big heaps, so the first run measures the peak untouched and
+    # the second one snapshots when it gets near that peak to attribute it to source lines.
+    fn = prepare()
+    tracemalloc.start()
+    try:
+        result = fn()
+        (retained, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    fn = prepare()
+    snapshotter = PeakSnapshotter(peak, interval)
+    tracemalloc.start()
+    try:
+        snapshotter.start()
+        try:
+            fn()
+        finally:
+            snapshotter.done.set()
+            snapshotter.join()
+        snapshot = snapshotter.snapshot or tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    stats = snapshot.filter_traces(IGNORE).statistics("lineno")
+    top = [LineStat(relative_location(s.traceback[0]), s.size, s.count) for s in stats[:top_n]]
+    return (result, MemoryReport(peak, retained, sum(s.count for s in stats), top))
@@ -0,0 +1,37 @@
+"""Work counters for solvers.
+
+Solvers call count("name", n) on their hot paths. Outside a collect() block that is one global check,
+so instrumented days cost next to nothing in ordinary runs. `python -m aoc run --metrics` solves each
+task inside collect() and reports the counts next to its timings, so an algorithmic change shows up
+as less work even when the wall-clock difference is lost in noise. Counts that take work to compute
+(e.g. summing a mask) should be guarded with enabled().
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+_counts: Optional[Counter] = None
+
+
+def enabled() -> bool:
+    return _counts is not None
+
+
+def count(name: str, n: int = 1) -> None:
+    if _counts is not None:
+        _counts[name] += n
+
+
+@contextmanager
+def collect(enable: bool = True) -> Iterator[Optional[Counter]]:
+    # Yields the counter the block's count() calls add to, or None (and counts nothing) if not
+    # `enable`; an enclosing collect() doesn't see the inner block's counts
+    global _counts
+    previous = _counts
+    _counts = Counter() if enable else None
+    try:
+        yield _counts
+    finally:
+        _counts = previous
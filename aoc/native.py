@@ -0,0 +1,208 @@
+"""Cross-implementation harness: the Python solution against the native ones.
+
+A day takes part by having `cpp/` (built with its CMake presets) and/or `rust/` (built with cargo)
+next to `python/`. Every variant is run as its own process as `<program> <input path>` and prints
+the part 1 answer, the part 2 answer and the seconds it spent loading and solving, one per line. The
+harness checks the answers agree and reports throughput over the input size and the peak resident
+memory of each process. Builds go to .cache/native/, so the day folders stay clean.
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from aoc import generators
+from aoc.budget import peak_memory
+from aoc.days import ROOT, Day, get_day
+
+
+BUILD_DIR = ROOT / ".cache" / "native"
+POLL_INTERVAL = 0.001
+
+# What the Python variant runs, so it can be measured like the native ones. Days with a stream()
+# are solved straight from it, as they would be on inputs too big to load. Given a number of jobs
+# (argv[2], 0 for none) the day's solve_parallel(path, jobs) is run instead.
+PYTHON_CODE = (
+    "import sys, time\n"
+    "from aoc.days import get_day\n"
+    "module = get_day(int(sys.argv[1])).load_module()\n"
+    "(jobs, path) = (int(sys.argv[2]), sys.argv[3])\n"
+    "read = getattr(module, 'stream', module.load)\n"
+    "t0 = time.perf_counter()\n"
+    "(answer1, answer2) = module.solve_parallel(path, jobs) if jobs else module.solve(read(path))\n"
+    "print(answer1, answer2, time.perf_counter() - t0, sep='\\n')\n"
+)
+
+
+class BuildError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Variant:
+    name: str
+    # Builds the variant if need be and returns the command to run, minus the input path
+    build: Callable[[Day], list[str]]
+    source: str  # folder of the day that has to exist for the variant to apply
+
+
+@dataclass
+class NativeResult:
+    variant: str
+    n: int
+    input_bytes: int
+    status: str  # "ok", "mismatch", "error" or "unavailable"
+    answers: Optional[tuple[str, str]] = None
+    solve_time: float = 0.0  # as reported by the program: loading and solving, not startup
+    wall_time: float = 0.0
+    peak_rss: int = 0  # bytes
+    error: Optional[str] = None
+
+    @property
+    def throughput(self) -> float:
+        # MB/s over the time the program spent on the input
+        return self.input_bytes / 1e6 / self.solve_time if (self.solve_time > 0) else 0.0
+
+
+def run_build(cmd: list[str], cwd: Path) -> None:
+    proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        output = (proc.stdout + proc.stderr).strip().splitlines()
+        raise BuildError(f"`{' '.join(cmd)}` failed:\n" + "\n".join(output[-15:]))
+
+
+def build_python(day: Day, jobs: Optional[int] = None) -> list[str]:
+    if jobs and not hasattr(day.load_module(), "solve_parallel"):
+        raise BuildError(f"day {day.number} has no solve_parallel() to run with --jobs")
+    return [sys.executable, "-c", PYTHON_CODE, str(day.number), str(jobs or 0)]
+
+
+def build_cpp(day: Day, preset: str = "opt") -> list[str]:
+    # The preset picks generator, compiler and build type; only the binary dir is overridden
+    if shutil.which("cmake") is None:
+        raise BuildError("cmake not found")
+    (source, binary_dir) = (day.path.parent.parent / "cpp", BUILD_DIR / day.name / f"cpp-{preset}")
+    run_build(["cmake", "--preset", preset, "-B", str(binary_dir)], source)
+    run_build(["cmake", "--build", str(binary_dir)], source)
+    return [str(binary_dir / "run")]
+
+
+def build_rust(day: Day) -> list[str]:
+    if shutil.which("cargo") is None:
+        raise BuildError("cargo not found")
+    manifest = day.path.parent.parent / "rust" / "Cargo.toml"
+    target_dir = BUILD_DIR / day.name / "rust"
+    run_build(
+        ["cargo", "build", "--release", "--manifest-path", str(manifest), "--target-dir", str(target_dir)],
+        ROOT,
+    )
+    # The binary is named after the package, which the templates call "rust"
+    return [str(target_dir / "release" / "rust")]
+
+
+VARIANTS = {
+    "python": Variant("python", build_python, "python"),
+    "cpp": Variant("cpp", build_cpp, "cpp"),
+    "rust": Variant("rust", build_rust, "rust"),
+}
+
+
+def available_variants(day: Day) -> list[str]:
+    return [name for (name, v) in VARIANTS.items() if (day.path.parent.parent / v.source).is_dir()]
+
+
+def run_variant(cmd: list[str], path: Path) -> tuple[list[str], float, int]:
+    # Peak RSS is sampled from the child while it runs. The ru_maxrss wait4() would give includes
+    # this Python process too, since the child starts out sharing its memory until exec.
+    with tempfile.TemporaryFile("w+") as stdout, tempfile.TemporaryFile("w+") as stderr:
+        t0 = time.perf_counter()
+        proc = subprocess.Popen([*cmd, str(path)], stdout=stdout, stderr=stderr, text=True)
+        peak = 0
+        while proc.poll() is None:
+            peak = max(peak, peak_memory(proc.pid) or 0)
+            time.sleep(POLL_INTERVAL)
+        wall_time = time.perf_counter() - t0
+        (stdout.seek(0), stderr.seek(0))
+        if proc.returncode != 0:
+            raise RuntimeError(f"exited with code {proc.returncode}: {stderr.read().strip()[-500:]}")
+        return (stdout.read().split(), wall_time, peak)
+
+
+def compare_day(
+    day_number: int,
+    sizes: Iterable[int],
+    variants: Optional[Iterable[str]] = None,
+    seed: int = 0,
+    repeats: int = 1,
+    cmake_preset: str = "opt",
+    jobs: Optional[int] = None,
+    log: Optional[Callable[[str], None]] = None,
+) -> list[NativeResult]:
+    day = get_day(day_number)
+    names = list(variants) if (variants is not None) else available_variants(day)
+    (commands, errors) = ({}, {})
+    for name in names:
+        try:
+            if name == "cpp":
+                commands[name] = build_cpp(day, cmake_preset)
+            elif name == "python":
+                commands[name] = build_python(day, jobs)
+            else:
+                commands[name] = VARIANTS[name].build(day)
+        except BuildError as e:
+            errors[name] = str(e)
+
+    results = []
+    for n in sizes:
+        path = generators.write(day_number, n, seed)
+        size = path.stat().st_size
+        batch = []
+        for name in names:
+            if name in errors:
+                batch += [NativeResult(name, n, size, "unavailable", error=errors[name])]
+                continue
+            try:
+                # Best of `repeats` by the program's own timing; peak RSS is the largest seen
+                runs = [run_variant(commands[name], path) for _ in range(repeats)]
+            except RuntimeError as e:
+                batch += [NativeResult(name, n, size, "error", error=str(e))]
+                continue
+            (output, wall_time, _) = min(runs, key=lambda r: float(r[0][2]))
+            batch += [NativeResult(
+                name, n, size, "ok", (output[0], output[1]), float(output[2]), wall_time,
+                max(rss for (_, _, rss) in runs),
+            )]
+        # The first variant to answer (Python, when it runs) is the reference
+        answered = [r for r in batch if r.answers is not None]
+        reference = answered[0].answers if answered else None
+        for r in answered:
+            if r.answers != reference:
+                (r.status, r.error) = ("mismatch", f"answered {r.answers}, {answered[0].variant} {reference}")
+        if log is not None:
+            for r in batch:
+                log(format_result(r))
+        results += batch
+    return results
+
+
+def format_size(num_bytes: int) -> str:
+    for (unit, scale) in (("GB", 1e9), ("MB", 1e6), ("KB", 1e3)):
+        if num_bytes >= scale:
+            return f"{num_bytes / scale:.1f} {unit}"
+    return f"{num_bytes} B"
+
+
+def format_result(r: NativeResult) -> str:
+    head = f"n={r.n:<10} {format_size(r.input_bytes):>9}  {r.variant:<7} {r.status:<11}"
+    if r.answers is None:
+        return f"{head} {(r.error or '').splitlines()[0] if r.error else ''}"
+    line = (
+        f"{head} {r.answers[0]:>12} {r.answers[1]:>12}  {r.solve_time:9.4f}s  {r.throughput:9.1f} MB/s"
+        f"  peak {r.peak_rss / 2**20:8.1f} MiB"
+    )
+    return line if (r.status == "ok") else f"{line}\n    {r.error}"
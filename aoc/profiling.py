@@ -0,0 +1,116 @@
+import cProfile
+import io
+import pstats
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from aoc.budget import Interrupted
+from aoc.days import ROOT
+
+
+PROFILE_DIR = ROOT / ".cache" / "profiles"
+
+
+@dataclass(frozen=True)
+class ProfileSpec:
+    day: int
+    part: Optional[int] = None
+    input_name: Optional[str] = None
+
+    @classmethod
+    def parse(cls, spec: str) -> "ProfileSpec":
+        match = re.fullmatch(r"day-(\d+)(?::pt([12]))?(?::(.+))?", spec)
+        if match is None:
+            raise ValueError(f"Invalid profile spec {spec!r}; expected day-N[:ptP[:input]]")
+        (day, part, input_name) = match.groups()
+        return cls(int(day), None if (part is None) else int(part), input_name)
+
+    def matches(self, day: int, part: int, input_name: str) -> bool:
+        return (
+            (self.day == day)
+            and (self.part in (None, part))
+            and (self.input_name in (None, input_name))
+        )
+
+
+@dataclass
+class ProfileReport:
+    pstats_path: Path
+    collapsed_path: Path
+    top: str
+
+
+def func_name(func: tuple[str, int, str]) -> str:
+    (filename, lineno, name) = func
+    if filename == "~":  # built-in
+        return name
+    path = Path(filename)
+    if path.is_relative_to(ROOT):
+        path = path.relative_to(ROOT)
+    return f"{path}:{lineno}({name})"
+
+
+def collapse(stats: pstats.Stats, min_time: float = 1e-6) -> list[str]:
+    # cProfile only keeps caller -> callee edges, not whole stacks, so rebuild stacks by walking
+    # down from the roots and splitting each function's time across paths in proportion to the
+    # cumulative time of the edge that led there. Recursive calls are folded into their first frame.
+    raw = stats.stats
+    callees: dict = {}
+    for (func, (_, _, _, _, callers)) in raw.items():
+        for (caller, edge) in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+    roots = [
+        f for (f, (_, _, _, _, callers)) in raw.items()
+        if (not callers) and ("_lsprof.Profiler" not in f[2])  # the profiler's own disable()
+    ]
+
+    totals: dict[str, float] = {}
+
+    def visit(func: tuple, stack: tuple[str, ...], on_stack: set, path_time: float) -> None:
+        (_, _, tt, ct, _) = raw[func]
+        if (ct <= 0) or (path_time < min_time):
+            return
+        scale = min(path_time / ct, 1.0)
+        stack += (func_name(func),)
+        self_time = tt * scale
+        if self_time >= min_time:
+            key = ";".join(stack)
+            totals[key] = totals.get(key, 0.0) + self_time
+        for (callee, edge_ct) in callees.get(func, {}).items():
+            if callee not in on_stack:
+                visit(callee, stack, on_stack | {callee}, edge_ct * scale)
+
+    for root in roots:
+        visit(root, (), {root}, raw[root][3])
+    return [f"{key} {round(t * 1e6)}" for (key, t) in sorted(totals.items()) if round(t * 1e6) > 0]
+
+
+def profile(
+    fn: Callable[[], Any],
+    label: str,
+    out_dir: Path = PROFILE_DIR,
+    top_n: int = 20,
+) -> tuple[Any, ProfileReport]:
+    profiler = cProfile.Profile()
+    try:
+        result = profiler.runcall(fn)
+    except Interrupted as e:
+        e.profile = write_report(profiler, label, out_dir, top_n)  # whatever ran before the stop
+        raise
+    return (result, write_report(profiler, label, out_dir, top_n))
+
+
+def write_report(profiler: cProfile.Profile, label: str, out_dir: Path, top_n: int) -> ProfileReport:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = label.replace(":", "_")
+    (pstats_path, collapsed_path) = (out_dir / f"{stem}.pstats", out_dir / f"{stem}.collapsed")
+    profiler.dump_stats(pstats_path)
+    stats = pstats.Stats(profiler)
+    with open(collapsed_path, "w") as f:
+        f.write("\n".join(collapse(stats)) + "\n")
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(top_n)
+    return ProfileReport(pstats_path, collapsed_path, stream.getvalue())
@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import os
+import time
+import traceback
+from contextlib import redirect_stdout
+from copy import deepcopy
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from aoc import answers, memprof, metrics, profiling
+from aoc.budget import Budget, Interrupted, install_interrupt_handler, resident_memory
+from aoc.cache import cached_load, file_digest
+from aoc.days import INPUTS, PARTS, Day, default_days, get_day, has_combined_solver
+
+# multiprocessing and concurrent.futures are imported where they're used: a one-off run of a single
+# day never starts a worker, and shouldn't pay to import them
+if TYPE_CHECKING:
+    import multiprocessing
+    from multiprocessing.connection import Connection
+
+
+# Statuses of tasks the runner stopped for going over their budget
+INTERRUPTED = ("timeout", "memory")
+
+POLL_INTERVAL = 0.05
+# How long a stopped worker gets to report where it was before it's killed outright
+STOP_GRACE = 2.0
+
+
+@dataclass(frozen=True)
+class Task:
+    day: int
+    part: int
+    input_name: str
+
+    @property
+    def label(self) -> str:
+        return f"day-{self.day}:pt{self.part}:{self.input_name}"
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    use_cache: bool = True
+    memoize: bool = True
+    combined: bool = True
+    trace_memory: bool = False
+    metrics: bool = False
+    profile: tuple[profiling.ProfileSpec, ...] = ()
+    profile_dir: Path = profiling.PROFILE_DIR
+    profile_top: int = 20
+    budget: Budget = Budget()
+    budgets: tuple[tuple[profiling.ProfileSpec, Budget], ...] = ()  # per day/part overrides
+
+    def budget_for(self, task: Task) -> Budget:
+        # Overrides apply in order on top of the default, so later and narrower specs win
+        budget = self.budget
+        for (spec, override) in self.budgets:
+            if spec.matches(task.day, task.part, task.input_name):
+                budget = budget.merge(override)
+        return budget
+
+    def should_profile(self, task: Task) -> bool:
+        return any(spec.matches(task.day, task.part, task.input_name) for spec in self.profile)
+
+    def should_memoize(self, task: Task) -> bool:
+        # Traced, counted and profiled runs exist to measure the solver, so they always run it
+        return self.memoize and not (self.trace_memory or self.metrics or self.should_profile(task))
+
+    def should_count(self) -> bool:
+        # Traced solvers run twice, which would double every count
+        return self.metrics and not self.trace_memory
+
+
+@dataclass
+class TaskResult:
+    task: Task
+    status: str
+    answer: Any = None
+    load_time: float = 0.0
+    solve_time: float = 0.0
+    error: Optional[str] = None
+    memory: Optional[memprof.MemoryReport] = None
+    profile: Optional[profiling.ProfileReport] = None
+    metrics: Optional[dict[str, int]] = None
+    # Both parts came from one solve() call; its timings are all reported on the part 1 result
+    combined: bool = False
+    # The answer came from the answer store and nothing was run
+    memoized: bool = False
+
+    @property
+    def interrupted(self) -> bool:
+        return self.status in INTERRUPTED
+
+    @property
+    def total_time(self) -> float:
+        return self.load_time + self.solve_time
+
+
+def make_tasks(
+    days: Optional[Iterable[int]] = None,
+    parts: Iterable[int] = PARTS,
+    inputs: Iterable[str] = INPUTS,
+) -> list[Task]:
+    if days is None:
+        days = default_days()
+    return [Task(d, p, name) for d in days for name in inputs for p in parts]
+
+
+def group_tasks(tasks: list[Task], options: RunOptions = RunOptions()) -> list[tuple[Task, ...]]:
+    # Both parts of a day on the same input go to one worker so they can share a solve() call
+    # (and its budget); traced and profiled tasks always run on their own
+    groups: dict[Any, list[Task]] = {}
+    for task in tasks:
+        separate = (not options.combined) or options.trace_memory or options.should_profile(task)
+        key = task if separate else (task.day, task.input_name, options.budget_for(task))
+        groups.setdefault(key, []).append(task)
+    return [tuple(sorted(group, key=lambda t: t.part)) for group in groups.values()]
+
+
+def load_input(day: Day, module: ModuleType, task: Task, options: RunOptions) -> Any:
+    path = day.input_path(task.input_name, task.part)
+    return cached_load(module, path) if options.use_cache else module.load(path)
+
+
+def execute(task: Task, options: RunOptions = RunOptions()) -> TaskResult:
+    (memory, profile) = (None, None)
+    try:
+        day = get_day(task.day)
+        module = day.load_module()
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            t0 = time.perf_counter()
+            data = load_input(day, module, task, options)
+            t1 = time.perf_counter()
+            with metrics.collect(options.should_count()) as counts:
+                if options.trace_memory:
+                    # Traced solvers run twice, so each run gets its own copy of the input
+                    prepare = lambda: day.bind(module, task.part, task.input_name, deepcopy(data))
+                    (answer, memory) = memprof.trace(prepare)
+                elif options.should_profile(task):
+                    thunk = day.bind(module, task.part, task.input_name, data)
+                    (answer, profile) = profiling.profile(
+                        thunk, task.label, options.profile_dir, options.profile_top)
+                else:
+                    answer = day.bind(module, task.part, task.input_name, data)()
+            t2 = time.perf_counter()
+    except Exception:
+        return TaskResult(task, "error", error=traceback.format_exc(limit=-1).strip())
+    return TaskResult(
+        task, "ok", answer, t1 - t0, t2 - t1, memory=memory, profile=profile,
+        metrics=None if (counts is None) else dict(counts),
+    )
+
+
+def execute_combined(tasks: tuple[Task, Task], options: RunOptions = RunOptions()) -> list[TaskResult]:
+    (task1, task2) = tasks
+    try:
+        day = get_day(task1.day)
+        module = day.load_module()
+        if not (has_combined_solver(module) and day.shares_input(task1.input_name)):
+            return [execute(task, options) for task in tasks]
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            t0 = time.perf_counter()
+            data = load_input(day, module, task1, options)
+            t1 = time.perf_counter()
+            with metrics.collect(options.should_count()) as counts:
+                (answer1, answer2) = day.bind(module, None, task1.input_name, data)()
+            t2 = time.perf_counter()
+    except Exception:
+        error = traceback.format_exc(limit=-1).strip()
+        return [TaskResult(task, "error", error=error, combined=True) for task in tasks]
+    # Like the timings, the counts of the shared solve() go on part 1
+    counted = None if (counts is None) else dict(counts)
+    return [
+        TaskResult(task1, "ok", answer1, t1 - t0, t2 - t1, combined=True, metrics=counted),
+        TaskResult(task2, "ok", answer2, combined=True),
+    ]
+
+
+def solve_group(tasks: tuple[Task, ...], options: RunOptions) -> list[TaskResult]:
+    if len(tasks) == 2:
+        return execute_combined(tasks, options)
+    return [execute(task, options) for task in tasks]
+
+
+def memo_key(task: Task) -> tuple[int, int, str, str]:
+    day = get_day(task.day)
+    path = day.input_path(task.input_name, task.part)
+    return (task.day, task.part, file_digest(path), answers.solver_digest(day.path))
+
+
+def execute_group(tasks: tuple[Task, ...], options: RunOptions = RunOptions()) -> list[TaskResult]:
+    if not all(options.should_memoize(task) for task in tasks):
+        return solve_group(tasks, options)
+    try:
+        keys = [memo_key(task) for task in tasks]
+    except (OSError, ValueError):
+        return solve_group(tasks, options)  # e.g. a missing input; let the solve report it
+
+    store = answers.AnswerStore()
+    try:
+        memoized = [store.get(*key) for key in keys]
+        if all(answer is not None for answer in memoized):
+            return [TaskResult(task, "ok", answer, memoized=True) for (task, answer) in zip(tasks, memoized)]
+        results = solve_group(tasks, options)
+        for (key, r) in zip(keys, results):
+            if (r.status == "ok") and (r.answer is not None):
+                store.put(*key, r.answer, r.solve_time)
+        return results
+    finally:
+        store.close()
+
+
+def budgeted_worker(tasks: tuple[Task, ...], options: RunOptions, conn: Connection) -> None:
+    install_interrupt_handler()
+    try:
+        results = execute_group(tasks, options)
+    except Interrupted as e:
+        results = [
+            TaskResult(task, "interrupted", error=e.where, profile=e.profile, combined=(len(tasks) > 1))
+            for task in tasks
+        ]
+    conn.send(results)
+    conn.close()
+
+
+@dataclass
+class Worker:
+    tasks: tuple[Task, ...]
+    budget: Budget
+    process: multiprocessing.Process
+    conn: Connection
+    started: float
+    peak_memory: int = 0
+    stop_status: Optional[str] = None
+    stop_reason: str = ""
+    stopped: float = 0.0
+
+    @classmethod
+    def start(cls, tasks: tuple[Task, ...], options: RunOptions) -> Worker:
+        import multiprocessing
+        (conn, child_conn) = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(target=budgeted_worker, args=(tasks, options, child_conn))
+        process.start()
+        child_conn.close()
+        return cls(tasks, options.budget_for(tasks[0]), process, conn, time.perf_counter())
+
+    def check(self, now: float) -> None:
+        self.peak_memory = max(self.peak_memory, resident_memory(self.process.pid) or 0)
+        (limit_time, limit_memory) = (self.budget.time, self.budget.memory)
+        if (limit_time is not None) and (now - self.started > limit_time):
+            self.stop("timeout", f"stopped after {now - self.started:.1f}s (budget {limit_time:g}s)", now)
+        elif (limit_memory is not None) and (self.peak_memory > limit_memory):
+            self.stop("memory", (
+                f"stopped at {self.peak_memory / 2**20:.0f} MiB resident "
+                f"(budget {limit_memory / 2**20:.0f} MiB)"
+            ), now)
+
+    def stop(self, status: str, reason: str, now: float) -> None:
+        # SIGTERM makes the worker raise Interrupted wherever the solver is, so it can still
+        # report its stack (and partial profile); kill() follows if it doesn't answer in time
+        (self.stop_status, self.stop_reason, self.stopped) = (status, reason, now)
+        self.process.terminate()
+
+    def collect(self, now: float) -> list[TaskResult]:
+        try:
+            results = self.conn.recv()
+        except EOFError:  # the worker died without reporting back
+            if self.stop_status is not None:
+                return self.abandon()
+            self.close()
+            error = f"worker exited with code {self.process.exitcode}"
+            return [TaskResult(task, "error", error=error) for task in self.tasks]
+        self.close()
+        for r in results:
+            if (r.status == "interrupted") and (self.stop_status is not None):
+                r.status = self.stop_status
+                r.error = f"{self.stop_reason}\n{r.error}"
+                r.solve_time = self.elapsed(r.task)
+        return results
+
+    def abandon(self) -> list[TaskResult]:
+        self.process.kill()
+        self.close()
+        combined = len(self.tasks) > 1
+        return [
+            TaskResult(task, self.stop_status, solve_time=self.elapsed(task), error=self.stop_reason,
+                       combined=combined)
+            for task in self.tasks
+        ]
+
+    def elapsed(self, task: Task) -> float:
+        # Parts that ran together are timed once, on the first of them
+        return (self.stopped - self.started) if (task == self.tasks[0]) else 0.0
+
+    def close(self) -> None:
+        self.process.join()
+        self.conn.close()
+
+
+def run_budgeted(
+    groups: list[tuple[Task, ...]],
+    jobs: Optional[int] = None,
+    options: RunOptions = RunOptions(),
+) -> list[TaskResult]:
+    # One process per group rather than a pool, so an over-budget group can be killed without
+    # taking anything else down
+    from multiprocessing.connection import wait
+    (pending, running, results) = (list(reversed(groups)), [], [])
+    jobs = jobs or os.cpu_count() or 1
+    while pending or running:
+        while pending and (len(running) < jobs):
+            running += [Worker.start(pending.pop(), options)]
+        ready = wait([w.conn for w in running], timeout=POLL_INTERVAL)
+        now = time.perf_counter()
+        for w in list(running):
+            if w.conn in ready:
+                results += w.collect(now)
+            elif w.stop_status is None:
+                w.check(now)
+                continue
+            elif now - w.stopped > STOP_GRACE:
+                results += w.abandon()
+            else:
+                continue
+            running.remove(w)
+    return results
+
+
+def run_tasks(
+    tasks: list[Task],
+    jobs: Optional[int] = None,
+    options: RunOptions = RunOptions(),
+) -> list[TaskResult]:
+    groups = group_tasks(tasks, options)
+    if any(options.budget_for(task) for task in tasks):
+        results = run_budgeted(groups, jobs, options)
+    elif (len(groups) == 1) or (jobs == 1):
+        results = [r for group in groups for r in execute_group(group, options)]
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        results = []
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(execute_group, group, options) for group in groups]
+            for future in as_completed(futures):
+                results += future.result()
+    order = {task: i for (i, task) in enumerate(tasks)}
+    return sorted(results, key=lambda r: order[r.task])
+
+
+def format_answer(answer: Any, width: int = 24) -> str:
+    text = str(answer)
+    if "\n" in text:
+        return f"<{text.count(chr(10)) + 1} lines>"
+    return text if (len(text) <= width) else text[:width - 3] + "..."
+
+
+def summarize_error(result: TaskResult, width: int = 40) -> str:
+    # The exception message for errors, the reason for tasks stopped over budget
+    lines = (result.error or "").split("\n")
+    return (lines[0] if result.interrupted else lines[-1])[:width]
+
+
+def format_metrics(results: list[TaskResult]) -> str:
+    # One line of counts per solver run; parts that shared a solve() have theirs on part 1
+    labelled = [(r.task.label, r.metrics) for r in results if r.metrics]
+    if not labelled:
+        return ""
+    width = max(len(label) for (label, _) in labelled)
+    lines = []
+    for (label, counts) in labelled:
+        counts_text = "  ".join(f"{name}={value:,}" for (name, value) in sorted(counts.items()))
+        lines += [f"{label.ljust(width)}  {counts_text}"]
+    return "\n".join(lines)
+
+
+def format_table(results: list[TaskResult]) -> str:
+    with_memory = any(r.memory is not None for r in results)
+    header = ("day", "part", "input", "status", "answer", "load (s)", "solve (s)")
+    header += ("peak (MiB)",) if with_memory else ()
+    rows = [header]
+    for r in results:
+        shared = r.combined and (r.task.part != 1)
+        note = "(memo)" if r.memoized else ("(pt1)" if shared else None)
+        row = (
+            str(r.task.day),
+            str(r.task.part),
+            r.task.input_name,
+            r.status,
+            format_answer(r.answer) if (r.status == "ok") else summarize_error(r),
+            note or f"{r.load_time:.3f}",
+            note or f"{r.solve_time:.3f}",
+        )
+        if with_memory:
+            row += (f"{r.memory.peak / 2**20:.1f}" if (r.memory is not None) else "",)
+        rows += [row]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = ["  ".join(cell.ljust(w) for (cell, w) in zip(row, widths)).rstrip() for row in rows]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+    return "\n".join(lines)
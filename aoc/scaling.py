@@ -0,0 +1,156 @@
+"""Empirical complexity checks on generated inputs.
+
+Each day's solvers run on seeded inputs of growing size `n` (see aoc/generators for what `n` counts
+per day), and the growth exponent k in time ~ n^k is fitted by least squares on a log-log scale. A
+check fails when k goes over what the day's algorithm should need, so a linear scan that picks up a
+quadratic step (a list.pop(0), a property recomputed per access, ...) is caught even though its
+answers stay right.
+"""
+
+import math
+import os
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from aoc import generators
+from aoc.days import PARTS, get_day
+
+
+# Allowance on top of the expected exponent for timer noise, cache effects and log factors: n log n
+# fits at about 1.1-1.2 over a 16x range of sizes, while an accidental quadratic step fits at 2
+TOLERANCE = 0.5
+
+
+@dataclass(frozen=True)
+class Expectation:
+    sizes: tuple[int, ...]
+    exponent: float  # expected growth in n
+    reason: str
+    parts: tuple[int, ...] = PARTS
+
+
+# Exponents are in terms of each generator's `n`, so a grid day that is linear in its cells
+# expects 2 when n is the side length. Day 15 isn't here because its work is set by the sensors'
+# ranges over the fixed 4M span rather than by how many there are, and day 19 never finishes.
+EXPECTED = {
+    1: Expectation((10_000, 40_000, 160_000), 1, "one pass over the elves, then a top 3"),
+    2: Expectation((20_000, 80_000, 320_000), 1, "one pass over the rounds"),
+    3: Expectation((15_000, 60_000, 240_000), 1, "one pass over the rucksacks"),
+    4: Expectation((20_000, 80_000, 320_000), 1, "one pass over the pairs"),
+    5: Expectation((5_000, 20_000, 80_000), 1, "each move touches a bounded number of crates"),
+    6: Expectation((50_000, 200_000, 800_000), 1, "one window scan per marker"),
+    7: Expectation((10_000, 40_000, 160_000), 1, "one post-order walk over the tree"),
+    8: Expectation((150, 300, 600), 2, "a few vectorised passes over the n x n cells"),
+    9: Expectation((1_000, 4_000, 16_000), 1, "a bounded number of steps per move"),
+    10: Expectation((5_000, 20_000, 80_000), 1, "one pass over the instructions"),
+    # Part 2 is the same loop for 10000 rounds instead of 20, far too slow to time at three sizes
+    11: Expectation((40, 160, 640), 1, "20 rounds, each handling every item once", parts=(1,)),
+    12: Expectation((50, 100, 200), 2, "a BFS expanding each of the 4n^2 cells once"),
+    13: Expectation((500, 2_000, 8_000), 1, "pairwise compares for part 1, a sort for part 2"),
+    14: Expectation((400, 1_600, 6_400), 2, "sand fills at most the n x n/2 cave"),
+    17: Expectation((500, 2_000, 8_000), 1, "the cycle to find is proportional to the jet pattern"),
+    18: Expectation((4_000, 16_000, 64_000), 1, "masks and a flood fill over a box of about 3n cells"),
+    20: Expectation((500, 1_000, 2_000), 2, "each of the n moves shifts O(n) positions"),
+    21: Expectation((4_000, 16_000, 64_000), 1, "one walk over the expression tree"),
+    22: Expectation((50, 100, 200), 2, "40n moves of up to 2n steps each"),
+}
+
+
+@dataclass
+class ScalingResult:
+    day: int
+    part: int
+    sizes: tuple[int, ...]
+    times: tuple[float, ...]
+    exponent: float
+    expected: Expectation
+
+    @property
+    def ok(self) -> bool:
+        return self.exponent <= self.expected.exponent + TOLERANCE
+
+
+def fit_exponent(sizes: Iterable[int], times: Iterable[float]) -> float:
+    # Least-squares slope of log(time) against log(n)
+    points = [(math.log(n), math.log(max(t, 1e-9))) for (n, t) in zip(sizes, times)]
+    mean_x = sum(x for (x, _) in points) / len(points)
+    mean_y = sum(y for (_, y) in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for (x, _) in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for (x, y) in points)
+    return sxy / sxx
+
+
+def time_solver(day: int, part: int, n: int, seed: int, repeats: int) -> float:
+    # Best of `repeats`; every run gets a freshly loaded input since some solvers consume theirs
+    d = get_day(day)
+    module = d.load_module()
+    path = generators.write(day, n, seed)
+    best = math.inf
+    for _ in range(repeats):
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            thunk = d.bind(module, part, str(path), module.load(path))
+            t0 = time.perf_counter()
+            thunk()
+            best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def check_day(
+    day: int,
+    parts: Iterable[int] = PARTS,
+    seed: int = 0,
+    repeats: int = 3,
+    scale: float = 1.0,
+    log: Optional[Callable[[str], None]] = None,
+) -> list[ScalingResult]:
+    expected = EXPECTED[day]
+    sizes = tuple(max(1, round(n * scale)) for n in expected.sizes)
+    results = []
+    for part in (p for p in parts if p in expected.parts):
+        # An untimed run first, so first-use costs (imports such as day 21's sympy) aren't timed
+        time_solver(day, part, sizes[0], seed, 1)
+        times = tuple(time_solver(day, part, n, seed, repeats) for n in sizes)
+        result = ScalingResult(day, part, sizes, times, fit_exponent(sizes, times), expected)
+        if log is not None:
+            log(format_result(result))
+        results += [result]
+    return results
+
+
+def check_parallel(
+    day: int,
+    seed: int = 0,
+    jobs: int = 2,
+    scale: float = 1.0,
+    log: Optional[Callable[[str], None]] = None,
+) -> bool:
+    # A day with a process-pool solve_parallel(path, jobs) must give its sequential solve()'s answers
+    # on the same generated inputs; the larger ones span several of the ranges the pool shares out
+    d = get_day(day)
+    module = d.load_module()
+    if not callable(getattr(module, "solve_parallel", None)):
+        return True
+    ok = True
+    for n in (max(1, round(n * scale)) for n in EXPECTED[day].sizes):
+        path = generators.write(day, n, seed)
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            expected = d.bind(module, None, str(path), module.load(path))()
+            answers = module.solve_parallel(path, jobs)
+        ok = ok and (answers == expected)
+        if log is not None:
+            label = f"day-{day}:par"
+            status = "ok" if (answers == expected) else f"FAIL  solve() gives {expected}"
+            log(f"{label:<10} solve_parallel(jobs={jobs}) on n={n}: {answers}  {status}")
+    return ok
+
+
+def format_result(r: ScalingResult) -> str:
+    timings = "  ".join(f"n={n}: {t:.4f}s" for (n, t) in zip(r.sizes, r.times))
+    limit = r.expected.exponent + TOLERANCE
+    label = f"day-{r.day}:pt{r.part}"
+    line = f"{label:<10} k={r.exponent:5.2f}  limit {limit:4.2f}  {'ok' if r.ok else 'FAIL':<4}  {timings}"
+    if not r.ok:
+        line += f"\n    expected ~n^{r.expected.exponent:.3g}: {r.expected.reason}"
+    return line
@@ -1,31 +1,164 @@
+import heapq
+import os
+import sys
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import inputs
+
+
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
+
+BLANK = -1  # the value line_values() gives blank lines
+DIGITS = np.zeros(256, dtype=np.int64)
+DIGITS[ord("0"):ord("9") + 1] = np.arange(10)
+# What each byte value is to line_values() when a chunk has more than digits and line breaks
+(DIGIT, NEWLINE, SPACE, OTHER) = range(4)
+BYTE_KINDS = np.full(256, OTHER, dtype=np.uint8)
+BYTE_KINDS[ord("0"):ord("9") + 1] = DIGIT
+BYTE_KINDS[ord("\n")] = NEWLINE
+BYTE_KINDS[list(b" \t\r\v\f")] = SPACE
+
+
+def trailing_spaces(kinds: np.ndarray) -> np.ndarray:
+    # Positions of the whitespace at the ends of lines, given every byte's BYTE_KINDS, as int()
+    # would ignore it; that includes the "\r" of CRLF line endings. Whitespace comes in runs of
+    # consecutive positions, and a run is trailing when a line break or the end of the buffer
+    # follows it.
+    spaces = np.flatnonzero(kinds == SPACE)
+    if len(spaces) == 0:
+        return spaces
+    run_ends = np.append(np.diff(spaces) != 1, True)
+    after = spaces[run_ends] + 1
+    trailing = (after == len(kinds)) | (kinds[np.minimum(after, len(kinds) - 1)] == NEWLINE)
+    if trailing.all():  # e.g. every run is the "\r" before a "\n"
+        return spaces
+    return spaces[trailing[np.cumsum(run_ends) - run_ends]]
+
+
+def line_values(chunk: bytes) -> np.ndarray:
+    # The number on every line of `chunk` (bytes, or any buffer such as a slice of a memory map), or
+    # BLANK for a blank line, parsed a digit place at a time across all lines at once rather than one
+    # int() per line. Any byte other than a digit or the line endings raises ValueError, as int()
+    # would, since a digit place would otherwise read it as a 0.
+    buf = np.frombuffer(chunk, dtype=np.uint8)
+    # Nothing but digits and "\n" when no byte sorts after "9" and the only ones before "0" are "\n"
+    plain = buf.max(initial=0) <= ord("9")
+    plain = plain and (np.count_nonzero(buf < ord("0")) == np.count_nonzero(buf == ord("\n")))
+    if not plain:
+        kinds = BYTE_KINDS[buf]
+        trailing = trailing_spaces(kinds)
+        if np.count_nonzero(kinds > NEWLINE) > len(trailing):
+            invalid = kinds > NEWLINE
+            invalid[trailing] = False
+            at = invalid.argmax()
+            raise ValueError(f"Unexpected byte {buf[at:at + 1].tobytes()!r} in a list of calories")
+        buf = np.delete(buf, trailing)
+    ends = np.flatnonzero(buf == ord("\n"))
+    if (len(buf) > 0) and (buf[-1] != ord("\n")):  # the last line of the file has no line ending
+        ends = np.append(ends, len(buf))
+    lengths = np.diff(ends, prepend=-1) - 1
+    values = np.zeros(len(ends), dtype=np.int64)
+    for place in range(int(lengths.max(initial=0))):
+        # Lines shorter than `place` digits would read into the line before, hence the mask
+        values += DIGITS[buf[ends - 1 - place]] * (lengths > place) * 10**place
+    values[lengths == 0] = BLANK
+    return values
+
+
+def group_totals(chunk: bytes) -> np.ndarray:
+    # Each elf's total, for a chunk holding whole groups of lines separated by blank lines
+    values = line_values(chunk)
+    if len(values) == 0:
+        return values
+    blank = values == BLANK
+    starts = np.flatnonzero(np.concatenate(([True], blank[:-1])))
+    values[blank] = 0
+    return np.add.reduceat(values, starts)
+
+
+def top_k(chunks: Iterable[bytes], k: int) -> list[int]:
+    # The k largest totals, largest first; only the k best so far are carried from one chunk to the
+    # next, so memory is bounded by the chunk size
+    best = np.zeros(0, dtype=np.int64)
+    for chunk in chunks:
+        totals = np.concatenate((best, group_totals(chunk)))
+        best = totals if (len(totals) <= k) else np.partition(totals, -k)[-k:]
+    return sorted(best.tolist(), reverse=True)
+
+
+def top_three(chunks: Iterable[bytes]) -> list[int]:
+    top = top_k(chunks, 3)
+    assert len(top) == 3
+    return top
+
+
+def solve_pt1(chunks: Iterable[bytes]) -> int:
+    (max_cals,) = top_k(chunks, 1)
+    return max_cals
 
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+def solve_pt2(chunks: Iterable[bytes]) -> int:
+    return sum(top_three(chunks))
 
 
-def solve_pt1(text: str) -> int:
-    groups = text.split("\n\n")
-    cals_per_elf = [sum(map(int, x.split("\n"))) for x in groups]
-    max_cals = max(cals_per_elf)
-    return max_cals
+def solve(chunks: Iterable[bytes]) -> Tuple[int, int]:
+    top = top_three(chunks)
+    return (top[0], sum(top))
+
+
+def top_k_in_range(fpath: str, k: int, bounds: Tuple[int, int]) -> list[int]:
+    # Worker side of top_k_parallel(): the file is mapped rather than read, so the range is never
+    # copied into the process
+    (start, end) = bounds
+    buf = np.memmap(fpath, dtype=np.uint8, mode="r")
+    return top_k([buf[start:end]], k)
+
+
+def top_k_parallel(
+    fpath: str, k: int, jobs: Optional[int] = None, size: int = inputs.CHUNK_SIZE
+) -> list[int]:
+    # top_k() over group-aligned byte ranges of about `size` bytes on a process pool; each range's
+    # k best are merged, so the result is exactly what the sequential top_k() gives
+    bounds = inputs.ranges(fpath, size, delimiter=group_delimiter(fpath))
+    jobs = jobs or os.cpu_count() or 1
+    work = partial(top_k_in_range, str(fpath), k)
+    if (jobs == 1) or (len(bounds) <= 1):
+        partials = list(map(work, bounds))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            partials = list(pool.map(work, bounds, chunksize=max(1, len(bounds) // (4 * jobs))))
+    return heapq.nlargest(k, chain.from_iterable(partials))
 
 
-def solve_pt2(text: str) -> int:
-    groups = text.split("\n\n")
-    cals_per_elf = [sum(map(int, x.split("\n"))) for x in groups]
-    cals_per_elf = sorted(cals_per_elf)
-    assert len(cals_per_elf) > 3
-    return sum(cals_per_elf[-3:])
+def solve_parallel(
+    fpath: str, jobs: Optional[int] = None, size: int = inputs.CHUNK_SIZE
+) -> Tuple[int, int]:
+    top = top_k_parallel(fpath, 3, jobs, size)
+    assert len(top) == 3
+    return (top[0], sum(top))
 
 
-def load(fpath: str) -> List[str]:
-    text = None
-    with open(fpath, "r") as f:
-        text = f.read()
-    return text
+def group_delimiter(fpath: str) -> bytes:
+    # The blank line between two groups, going by the first line's ending
+    with open(fpath, "rb") as f:
+        return b"\r\n\r\n" if f.readline().endswith(b"\r\n") else b"\n\n"
+
+
+def stream(fpath: str) -> Iterator[bytes]:
+    # Chunks that end on a blank line, so no elf's group is split between two of them
+    return inputs.chunks(fpath, delimiter=group_delimiter(fpath))
+
+
+def load(fpath: str) -> list[bytes]:
+    return list(stream(fpath))
 
 
 def main() -> int:
@@ -43,6 +176,12 @@ def main() -> int:
     print(f"[EXAMPLE] Answer to Part 2: {answer2}")
     assert answer2 == example_answer2
 
+    # Inputs saved with Windows line endings or with whitespace left at the ends of lines
+    crlf = EXAMPLE_DATA_PATH.read_bytes().replace(b"\n", b"\r\n")
+    assert solve([crlf]) == (example_answer1, example_answer2)
+    spaced = EXAMPLE_DATA_PATH.read_bytes().replace(b"\n", b" \t\n")
+    assert solve([spaced]) == (example_answer1, example_answer2)
+
     print(f"[TEST] Answer to Part 1: {solve_pt1(data2)}")
     print(f"[TEST] Answer to Part 2: {solve_pt2(data2)}")
 
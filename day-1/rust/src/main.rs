@@ -1,4 +1,6 @@
+use std::env;
 use std::fs;
+use std::time::Instant;
 
 fn solve_pt1(text: &str) -> u32 {
     let cals_per_elf: Vec<u32> = text
@@ -21,7 +23,19 @@ fn load(fname: String) -> String {
     fs::read_to_string(fname).expect("Unable to load data!")
 }
 
+// Solves a single input for the cross-implementation harness (aoc/native.py), printing both
+// answers and the seconds spent loading and solving, one per line.
+fn run_harness(fname: String) {
+    let t0 = Instant::now();
+    let data = load(fname);
+    let (answer1, answer2) = (solve_pt1(&data), solve_pt2(&data));
+    println!("{}\n{}\n{}", answer1, answer2, t0.elapsed().as_secs_f64());
+}
+
 fn main() {
+    if let Some(fname) = env::args().nth(1) {
+        return run_harness(fname);
+    }
     let example_data = load(String::from("./../data/example.dat"));
     let test_data = load(String::from("./../data/test.dat"));
 
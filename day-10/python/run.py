@@ -1,14 +1,18 @@
-import numpy as np
+import sys
 from pathlib import Path
+from typing import Iterable, Iterator
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import inputs
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
-EXAMPLE_SOLUTION_PT2_DATA_PATH = Path.cwd().parent / "data" / "example_solution_pt2.dat"
-TEST_SOLUTION_PT2_DATA_PATH = Path.cwd().parent / "data" / "test_solution_pt2.dat"
 
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
+EXAMPLE_SOLUTION_PT2_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example_solution_pt2.dat"
+TEST_SOLUTION_PT2_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test_solution_pt2.dat"
 
-def parse(instructions: list[str]) -> list[int]:
+
+def parse(instructions: Iterable[str]) -> list[int]:
     history = [1]
     for instr in instructions:
         history += [history[-1]]
@@ -17,38 +21,50 @@ def parse(instructions: list[str]) -> list[int]:
     return history
 
 
-def solve_pt1(instructions: list[str]) -> int:
-    history = parse(instructions)
+def signal_strength(history: list[int]) -> int:
     return sum([i * history[i - 1] for i in range(20, 221, 40)])
 
 
-def solve_pt2(instructions: list[str]) -> int:
-    history = parse(instructions)
+def render(history: list[int]) -> str:
     screen = [["." for _ in range(40)] for _ in range(6)]
     for row in range(6):
         for col in range(40):
             spos = history[(40 * row) + col]
-            if col in np.clip([spos - 1, spos, spos + 1], 0, 39):
+            if col in {min(max(s, 0), 39) for s in (spos - 1, spos, spos + 1)}:
                 screen[row][col] = "#"
     screen = "\n".join(["".join(line) for line in screen])
     return screen
 
 
+def solve_pt1(instructions: Iterable[str]) -> int:
+    return signal_strength(parse(instructions))
+
+
+def solve_pt2(instructions: Iterable[str]) -> int:
+    return render(parse(instructions))
+
+
+def solve(instructions: Iterable[str]) -> tuple[int, str]:
+    history = parse(instructions)
+    return (signal_strength(history), render(history))
+
+
+def stream(fpath: str) -> Iterator[str]:
+    return inputs.text_lines(fpath)
+
+
 def load(fpath: str) -> list[str]:
-    text = None
-    with open(fpath, "r") as f:
-        text = f.read()
-    return text
+    return list(stream(fpath))
 
 
 def main() -> int:
-    data1 = load(EXAMPLE_DATA_PATH).split("\n")
-    data2 = load(TEST_DATA_PATH).split("\n")
+    data1 = load(EXAMPLE_DATA_PATH)
+    data2 = load(TEST_DATA_PATH)
 
     example_solution1 = 13140
-    example_solution2 = load(EXAMPLE_SOLUTION_PT2_DATA_PATH)
+    example_solution2 = "\n".join(load(EXAMPLE_SOLUTION_PT2_DATA_PATH))
     test_solution1 = 12460
-    test_solution2 = load(TEST_SOLUTION_PT2_DATA_PATH)
+    test_solution2 = "\n".join(load(TEST_SOLUTION_PT2_DATA_PATH))
 
     example_answer1 = solve_pt1(data1)
     print(f"[EXAMPLE] Answer to Part 1: {example_answer1}")
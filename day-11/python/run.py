@@ -1,10 +1,11 @@
+from copy import deepcopy
 from dataclasses import dataclass
 from math import lcm
 from pathlib import Path
 
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 
 @dataclass
@@ -47,6 +48,11 @@ def solve_pt2(monkeys: list[Monkey]) -> int:
     return x * y
 
 
+def solve(monkeys: list[Monkey]) -> tuple[int, int]:
+    # Both parts move items between monkeys, so part 1 gets its own copy
+    return (solve_pt1(deepcopy(monkeys)), solve_pt2(monkeys))
+
+
 def load(fpath: str) -> list[Monkey]:
     text = None
     with open(fpath, "r") as f:
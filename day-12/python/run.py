@@ -1,59 +1,47 @@
-from __future__ import annotations
-
+import sys
 import numpy as np
-from collections import deque
-from dataclasses import dataclass
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import grid
+
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 
-@dataclass
-class Node:
-    coords: tuple[int, int]
-    parent: Node = None
+def climbable(here: np.ndarray, there: np.ndarray) -> np.ndarray:
+    return there <= here + 1
 
-    def __eq__(self, other: Node):
-        return self.coords == other.coords
 
-    def path_to_root(self):
-        if self.parent is None:
-            return []
-        return self.parent.path_to_root() + [self]
+def descendable(here: np.ndarray, there: np.ndarray) -> np.ndarray:
+    # The reverse of climbable: a step back along a path that could climb from `there` to `here`
+    return here <= there + 1
 
 
-def path_length(hmap: np.ndarray, start: tuple[int, int], end: tuple[int, int]) -> int:
-    (m, n) = hmap.shape
-    src = Node(start)
-    q = deque()
-    q.append(src)
-    visited = {src.coords}
-    while q:
-        current_node = q.popleft()
-        (i, j) = current_node.coords
-        if (i, j) == end:
-            return len(current_node.path_to_root())
-        for (i_off, j_off) in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-            (i_next, j_next) = (i + i_off, j + j_off)
-            if (0 <= i_next < m) and (0 <= j_next < n) and (hmap[i_next, j_next] <= hmap[i, j] + 1):
-                if (i_next, j_next) not in visited:
-                    next_node = Node((i_next, j_next), parent=current_node)
-                    q.append(next_node)
-                    visited |= {(i_next, j_next)}
-    return 99999
+def path_length(hmap: np.ndarray, starts: np.ndarray, end: tuple[int, int]) -> int:
+    # `starts` is a boolean mask, so every possible start is searched from at once
+    dist = grid.bfs_distances(starts, grid.step_edges(hmap, climbable))
+    return int(dist[end]) if (dist[end] >= 0) else 99999
 
 
 def solve_pt1(hmap: np.ndarray, start: tuple[int, int], end: tuple[int, int]) -> int:
-    return path_length(hmap, start, end)
+    starts = np.zeros(hmap.shape, dtype=bool)
+    starts[start] = True
+    return path_length(hmap, starts, end)
 
 
 def solve_pt2(hmap: np.ndarray, end: tuple[int, int]) -> int:
-    shortest_path = 99999
-    for start in [tuple(p) for p in np.argwhere(hmap == 0)]:
-        shortest_path = min(shortest_path, path_length(hmap, start, end))
-    return shortest_path
+    return path_length(hmap, hmap == 0, end)
+
+
+def solve(hmap: np.ndarray, start: tuple[int, int], end: tuple[int, int]) -> tuple[int, int]:
+    # One search backwards from the end gives the distance from every possible start at once
+    ends = np.zeros(hmap.shape, dtype=bool)
+    ends[end] = True
+    dist = grid.bfs_distances(ends, grid.step_edges(hmap, descendable))
+    dist = np.where(dist >= 0, dist, 99999)
+    return (int(dist[start]), int(dist[hmap == 0].min()))
 
 
 def load(fpath: str) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
@@ -1,16 +1,21 @@
 import functools
+import sys
 from pathlib import Path
 from typing import Union
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import metrics
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 
 def is_valid_packet(x: Union[int, list], y: Union[int, list]) -> bool:
     def is_int(x) -> bool: return isinstance(x, int)
     def is_list(x) -> bool: return isinstance(x, list)
 
+    metrics.count("packet_compares")
     if is_int(x) and is_int(y):
         if x < y:
             return True
@@ -60,6 +65,10 @@ def solve_pt2(data: list[tuple]) -> int:
     return i_divider_packet1 * i_divider_packet2
 
 
+def solve(data: list[tuple]) -> tuple[int, int]:
+    return (solve_pt1(data), solve_pt2(data))
+
+
 def load(fpath: str) -> str:
     text = None
     with open(fpath, "r") as f:
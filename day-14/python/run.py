@@ -1,11 +1,15 @@
+import sys
 import numpy as np
 from dataclasses import dataclass
 from pathlib import Path
 from enum import IntEnum
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import grid, metrics
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 
 @dataclass
@@ -33,73 +37,54 @@ def draw(feature_map: np.ndarray):
 
 
 def solve_pt1(map_data: Map) -> int:
-    (m, source) = (np.copy(map_data.data), map_data.source)
-    (num_row, num_col) = m.shape
+    # A free column either side and a free row below the scan; sand reaching them is in the abyss
+    blocked = grid.pad_mask(map_data.data == Feature.Rock, ((0, 1), (1, 1)))
+    (num_row, num_col) = blocked.shape
+    # Each grain follows the previous grain's path until that path's last free cell, so keep
+    # the path as a stack instead of dropping every grain from the source again
+    path = [(map_data.source[0], map_data.source[1] + 1)]
     num_stationary_sand_particles = 0
-    able_to_drop_sand = True
-    while able_to_drop_sand:
-        (i, j) = source
-        falling = True
-        while falling:
-            if i + 1 >= num_row:
-                return num_stationary_sand_particles
-            elif m[i + 1, j] == Feature.Air:
-                (i, j) = (i + 1, j)
-            elif j - 1 < 0:
-                return num_stationary_sand_particles
-            elif m[i + 1, j - 1] == Feature.Air:
-                (i, j) = (i + 1, j - 1)
-            elif j + 1 >= num_col:
-                return num_stationary_sand_particles
-            elif m[i + 1, j + 1] == Feature.Air:
-                (i, j) = (i + 1, j + 1)
-            elif j == 0:
-                return num_stationary_sand_particles
-            else:
-                m[i, j] = Feature.Sand
-                num_stationary_sand_particles += 1
+    while path:
+        (i, j) = path[-1]
+        if (i + 1 >= num_row) or (j == 0) or (j == num_col - 1):
+            return num_stationary_sand_particles
+        for dj in (0, -1, 1):
+            if not blocked[i + 1, j + dj]:
+                path += [(i + 1, j + dj)]
+                metrics.count("sand_steps")
                 break
+        else:
+            blocked[i, j] = True
+            num_stationary_sand_particles += 1
+            path.pop()
+    return num_stationary_sand_particles
 
 
 def solve_pt2(map_data: Map) -> int:
-    (m, source) = (np.copy(map_data.data), list(map_data.source))
-    m = np.pad(m, ((0, 2), (0, 0)))
-    m[-1, :] = Feature.Rock
-    num_col = m.shape[1]
-    num_stationary_sand_particles = 0
-    able_to_drop_sand = True
-    while able_to_drop_sand:
-        (i, j) = source
-        falling = True
-        while falling:
-            if m[i + 1, j] == Feature.Air:
-                (i, j) = (i + 1, j)
-            elif j - 1 < 0:
-                m = np.pad(m, ((0, 0), (1, 0)))
-                m[-1, 0] = Feature.Rock
-                (j, source[1], num_col) = (j + 1, source[1] + 1, num_col + 1)
-            elif m[i + 1, j - 1] == Feature.Air:
-                (i, j) = (i + 1, j - 1)
-            elif j + 1 >= num_col:
-                m = np.pad(m, ((0, 0), (0, 1)))
-                m[-1, -1] = Feature.Rock
-                num_col += 1
-            elif m[i + 1, j + 1] == Feature.Air:
-                (i, j) = (i + 1, j + 1)
-            elif [i, j] == source:
-                num_stationary_sand_particles += 1
-                return num_stationary_sand_particles
-            else:
-                m[i, j] = Feature.Sand
-                num_stationary_sand_particles += 1
-                break
+    # With a floor, sand ends up in every cell reachable from the source by falling straight or
+    # diagonally, so fill the cone row by row: a cell fills if any of the three above it did
+    (m, (i_source, j_source)) = (map_data.data, map_data.source)
+    num_row = m.shape[0] + 1  # the floor is two below the lowest rock, so one more row of sand
+    margin = num_row
+    rock = grid.pad_mask(m == Feature.Rock, ((0, 1), (margin, margin)))
+    sand = np.zeros(rock.shape, dtype=bool)
+    sand[i_source, j_source + margin] = True
+    for i in range(i_source + 1, num_row):
+        above = sand[i - 1]
+        sand[i] = (above | grid.shift(above, (1,), False) | grid.shift(above, (-1,), False)) & ~rock[i]
+    metrics.count("cone_rows", max(num_row - i_source - 1, 0))
+    return int(sand.sum())
+
+
+def solve(map_data: Map) -> tuple[int, int]:
+    return (solve_pt1(map_data), solve_pt2(map_data))
 
 
 def load(fpath: str) -> Map:
     with open(fpath, "r") as f:
         data = f.read().split("\n")
     data = [[list(map(int, coords.split(",")[::-1])) for coords in line.split(" -> ")] for line in data]
-    (i_max, j_min, j_max) = (0, np.Inf, 0)
+    (i_max, j_min, j_max) = (0, np.inf, 0)
     for rock_path in data:
         for (i, j) in rock_path:
             (i_max, j_min, j_max) = (max(i, i_max), min(j, j_min), max(j, j_max))
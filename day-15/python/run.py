@@ -1,9 +1,12 @@
-import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import inputs
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 
 Point = tuple[int, int]
@@ -85,12 +88,14 @@ def solve_pt2(pairs: list[SensorBeaconPair]) -> int:
                 return calculate_tuning_signal(pt)
 
 
+def solve(pairs: list[SensorBeaconPair], y: int) -> tuple[int, int]:
+    return (solve_pt1(pairs, y), solve_pt2(pairs))
+
+
 def load(fpath: str) -> list[SensorBeaconPair]:
-    text = None
-    with open(fpath, "r") as f:
-        text = f.read().split("\n")
-    data = [[list(map(int, p)) for p in re.findall(r"x=(-?\d+), y=(-?\d+)", line)] for line in text]
-    data = [SensorBeaconPair(tuple(s), tuple(b)) for (s, b) in data]
+    # Each line holds sensor x, y then beacon x, y
+    coords = inputs.ints(fpath).reshape(-1, 4).tolist()
+    data = [SensorBeaconPair((sx, sy), (bx, by)) for (sx, sy, bx, by) in coords]
     return data
 
 
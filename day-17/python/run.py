@@ -1,9 +1,13 @@
+import sys
 import numpy as np
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import grid, metrics
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 
 Rock = np.ndarray
@@ -18,6 +22,9 @@ ROCKS: tuple[Rock] = (
 )
 
 
+SURFACE_DEPTH = 64  # rows below the top that the cycle detection looks at
+
+
 class JetPattern:
     def __init__(self, pattern: str) -> None:
         self.jets = [(-1 if (c == "<") else 1) for c in list(pattern)]
@@ -36,9 +43,11 @@ class JetPattern:
 class Chamber:
     def __init__(self, data: np.ndarray) -> None:
         self.data = data
+        self._highest_rock = 0
+        self._tops = np.zeros(data.shape[1], dtype=np.int64)  # height of each column's highest rock
 
-    def expand_height(self, n_row: int) -> int:
-        self.data = np.pad(self.data, pad_width=((0, n_row), (0, 0)))
+    def expand_height(self, n_row: int) -> None:
+        self.data = grid.grow(self.data, n_row, axis=0)
 
     def height(self) -> int:
         return self.data.shape[0]
@@ -47,28 +56,31 @@ class Chamber:
         return self.data.shape[1]
 
     def does_overlap(self, rock: Rock, i_bl: int, j_bl: int) -> bool:
+        metrics.count("overlap_checks")
         return np.any(rock & self.data[i_bl:i_bl + rock.shape[0], j_bl:j_bl + rock.shape[1]])
 
     def set_rock(self, rock: Rock, i: int, j: int) -> None:
         self.data[i:i + rock.shape[0], j:j + rock.shape[1]] |= rock
+        self._highest_rock = max(self._highest_rock, i + rock.shape[0])
+        tops = self._tops[j:j + rock.shape[1]]
+        np.maximum(tops, i + rock.shape[0] - np.argmax(rock[::-1], axis=0), out=tops)
 
-    def highest_rock(self):
-        rocks = np.argwhere(np.logical_or.reduce(self.data, 1) == True)
-        if len(rocks) > 0:
-            return int(rocks[-1]) + 1
-        return 0
+    def highest_rock(self) -> int:
+        return self._highest_rock
+
+    def surface(self) -> tuple[int, ...]:
+        # How far below the highest rock each column's top is. A column no rock lands in any more
+        # would otherwise get deeper forever and no state would ever repeat, so depths are capped.
+        return tuple(np.minimum(self._highest_rock - self._tops, SURFACE_DEPTH).tolist())
 
 
 def simulate_rock_fall(chamber: Chamber, rock: Rock, jp: JetPattern) -> Chamber:
     # Pad chamber
-    (ch, rh, hr) = (chamber.height(), rock.shape[0], chamber.highest_rock())
-    if ch < (hr + 3 + rh):
-        num_rows_to_add = (hr + 3 + rh) - ch
-        chamber.expand_height(num_rows_to_add)
+    (rh, rw) = rock.shape
+    hr = chamber.highest_rock()
+    chamber.expand_height(hr + 3 + rh)
 
     # Simulate
-    hr = chamber.highest_rock()
-    (rh, rw) = rock.shape
     (i_rock, j_rock) = (hr + 3, 2)
     able_to_fall = True
     while able_to_fall:
@@ -84,42 +96,63 @@ def simulate_rock_fall(chamber: Chamber, rock: Rock, jp: JetPattern) -> Chamber:
             break
         (i_rock, j_rock) = (i_new, j_new)
     chamber.set_rock(rock, i_rock, j_rock)
+    metrics.count("rocks")
     return chamber
 
 
 def solve_pt1(jp: JetPattern) -> int:
-    chamber = Chamber(data=np.ndarray((3, 7), dtype=bool))
+    chamber = Chamber(data=np.zeros((3, 7), dtype=bool))
     for i in range(2022):
         chamber = simulate_rock_fall(chamber, ROCKS[i % len(ROCKS)], jp)
     hr = chamber.highest_rock()
     return hr
 
 
-def solve_pt2(jp: JetPattern) -> int:
-    chamber = Chamber(data=np.ndarray((3, 7), dtype=bool))
-    num_rock = len(ROCKS)
-    history = np.array([0])
-
-    (start, end) = (None, None)
-    (uids, uids_as_list) = (set(), [None])
-    for i in range(10_000):
-        rock_type = i % num_rock
-        if i >= 1:
-            dh = history[i] - history[i - 1]
-            uid = (dh, rock_type, jp.index)
-            if uid in uids:
-                (start, end) = (uids_as_list.index(uid), i)
-                period = end - start
-                break
-            uids |= {uid}
-            uids_as_list += [uid]
-        chamber = simulate_rock_fall(chamber, ROCKS[rock_type], jp)
-        history = np.append(history, [chamber.highest_rock()])
-    else:
-        raise ValueError("Unable to find period!")
+State = tuple[int, int, tuple[int, ...]]  # (rock type, jet index, surface) before a rock falls
 
+
+def repeats(history: list[int], states: list[State], start: int, period: int) -> bool:
+    # Whether the `period` rocks from `start` on fall exactly like the `period` rocks after them:
+    # each starts from the same state and raises the tower by the same amount
+    return all(
+        (states[k] == states[k + period])
+        and (history[k + 1] - history[k] == history[k + period + 1] - history[k + period])
+        for k in range(start, start + period)
+    )
+
+
+def find_cycle(jp: JetPattern, min_rocks: int = 0, max_rocks: int = 100_000) -> tuple[list[int], int, int]:
+    # Tower height after each rock, simulated until the fall pattern has repeated for a full period
+    # and there are at least `min_rocks` of them. A state seen again is only a candidate period, so
+    # it has to be confirmed against the period before it. From `start` on, the tower grows by the
+    # same amount every `end - start` rocks.
+    chamber = Chamber(data=np.zeros((3, 7), dtype=bool))
+    num_rock = len(ROCKS)
+    history = [0]
+    states: list[State] = []
+    last_seen: dict[State, int] = {}
+    cycle = None
+    for i in range(max_rocks):
+        state = (i % num_rock, jp.index, chamber.surface())
+        states += [state]
+        if (cycle is None) and (state in last_seen):
+            period = i - last_seen[state]
+            if (i >= 2 * period) and repeats(history, states, i - 2 * period, period):
+                cycle = (i - 2 * period, i - period)
+        if (cycle is not None) and (i >= min_rocks):
+            return (history, *cycle)
+        last_seen[state] = i
+        chamber = simulate_rock_fall(chamber, ROCKS[state[0]], jp)
+        history += [chamber.highest_rock()]
+    raise ValueError("Unable to find period!")
+
+
+def extrapolate_height(history: list[int], start: int, end: int, num_rocks: int) -> int:
+    if num_rocks < len(history):
+        return history[num_rocks]
+    period = end - start
     moves_start = start
-    moves_left = 1_000_000_000_000 - moves_start
+    moves_left = num_rocks - moves_start
     num_period = moves_left // period
     remaining_moves = moves_left % period
 
@@ -131,6 +164,20 @@ def solve_pt2(jp: JetPattern) -> int:
     return total_height
 
 
+def solve_pt2(jp: JetPattern) -> int:
+    (history, start, end) = find_cycle(jp)
+    return extrapolate_height(history, start, end, 1_000_000_000_000)
+
+
+def solve(jp: JetPattern) -> tuple[int, int]:
+    # Simulating at least 2022 rocks makes part 1 an exact lookup rather than an extrapolation
+    (history, start, end) = find_cycle(jp, min_rocks=2022)
+    return (
+        extrapolate_height(history, start, end, 2022),
+        extrapolate_height(history, start, end, 1_000_000_000_000),
+    )
+
+
 def load(fpath: str) -> JetPattern:
     text = None
     with open(fpath, "r") as f:
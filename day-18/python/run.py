@@ -1,90 +1,54 @@
-from __future__ import annotations
-
+import sys
 import numpy as np
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import grid, inputs
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
-
-
-Point = list[int, int, int]
-
-
-class Cube:
-    def __init__(self, cube_id: int, x: Point):
-        self.cube_id = cube_id
-        self.x = np.array(x)
-        self.neighbours = []
 
-    def is_neighbour(self, other: Cube) -> bool:
-        if np.sum(np.abs(self.x - other.x)) == 1:
-            return True
-        return False
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
-    def surface_area(self) -> int:
-        assert len(self.neighbours) <= 6
-        return 6 - len(self.neighbours)
 
+Points = np.ndarray  # (n, 3) integer coordinates
 
-def solve_pt1(cubes: list[Cube]) -> int:
-    return sum([c.surface_area() for c in cubes])
 
+def lava_mask(points: Points) -> np.ndarray:
+    # Occupancy grid with at least one empty cell on every side of the droplet
+    ijk = points - points.min(axis=0) + 1
+    lava = np.zeros(ijk.max(axis=0) + 2, dtype=bool)
+    lava[tuple(ijk.T)] = True
+    return lava
 
-def solve_pt2(cubes: list[Cube]) -> int:
-    # Create bounding box of water
-    all_ijk = np.array([c.x for c in cubes])
-    all_ijk -= np.min(all_ijk, axis=0)  # shift to zero in each direction
-    all_ijk += 1  # add an offset for indexing
-    water_box = np.ones((np.max(all_ijk, axis=0) + 2), dtype=bool)
 
-    # Remove lava cubes
-    for (i, j, k) in all_ijk:
-        water_box[i, j, k] = False
+def exposed_faces(lava: np.ndarray, outside: np.ndarray) -> int:
+    return int(sum(np.sum(lava & grid.neighbour(outside, o, True)) for o in grid.OFFSETS_3D))
 
-    # Construct grid of connected cubes from water cube locations
-    water_cubes = points_to_connected_cubes(np.argwhere(water_box == True))
 
-    # Proliferate to find all connected outer water cubes
-    outer_water_cubes_ids = [next(c.cube_id for c in water_cubes if np.all(c.x == [0, 0, 0]))]
-    searching = True
-    while searching:
-        found_new_neighbour = False
-        for i in range(len(outer_water_cubes_ids)):  # cube
-            cube_id = outer_water_cubes_ids[i]
-            for n in water_cubes[cube_id].neighbours:
-                if n.cube_id not in outer_water_cubes_ids:
-                    outer_water_cubes_ids += [n.cube_id]
-                    found_new_neighbour = True
-        if not found_new_neighbour:
-            break
+def solve_pt1(points: Points) -> int:
+    lava = lava_mask(points)
+    return exposed_faces(lava, ~lava)
 
-    # Get surface area of enclosing water region
-    water_surface_area = sum([water_cubes[c_id].surface_area() for c_id in outer_water_cubes_ids])
 
-    # Remove surface area of outside bounding box (only want the inner surface)
-    (h, w, d) = water_box.shape
-    bbox_outer_surface_area = 2 * (h * w + w * d + h * d)
-    water_surface_area -= bbox_outer_surface_area
-    return water_surface_area
+def solve_pt2(points: Points) -> int:
+    # Water floods in from a corner of the padded box and only ever touches the outer surface
+    lava = lava_mask(points)
+    seed = np.zeros(lava.shape, dtype=bool)
+    seed[0, 0, 0] = True
+    water = grid.flood_fill(~lava, seed)
+    return exposed_faces(lava, water)
 
 
-def points_to_connected_cubes(points: list[Point]) -> list[Cube]:
-    cubes = [Cube(i, point) for (i, point) in enumerate(points)]
-    for i in range(len(cubes)):
-        for j in range(i + 1, len(cubes)):
-            if cubes[i].is_neighbour(cubes[j]):
-                cubes[i].neighbours += [cubes[j]]
-                cubes[j].neighbours += [cubes[i]]
-    return cubes
+def solve(points: Points) -> tuple[int, int]:
+    lava = lava_mask(points)
+    seed = np.zeros(lava.shape, dtype=bool)
+    seed[0, 0, 0] = True
+    water = grid.flood_fill(~lava, seed)
+    return (exposed_faces(lava, ~lava), exposed_faces(lava, water))
 
 
-def load(fpath: str) -> list[Cube]:
-    text = None
-    with open(fpath, "r") as f:
-        text = f.read().split("\n")
-    points = [list(map(int, line.split(","))) for line in text]
-    return points_to_connected_cubes(points)
+def load(fpath: str) -> Points:
+    return inputs.ints(fpath).reshape(-1, 3)
 
 
 def main() -> int:
@@ -103,7 +67,7 @@ def main() -> int:
     example_answer2 = solve_pt2(load(EXAMPLE_DATA_PATH))
     print(f"[EXAMPLE] Answer to Part 2: {example_answer2}")
     assert example_answer2 == example_solution2
-    test_answer2 = solve_pt2(load(TEST_DATA_PATH))  # Takes ~2m 40s
+    test_answer2 = solve_pt2(load(TEST_DATA_PATH))
     print(f"[TEST] Answer to Part 2: {test_answer2}")
     assert test_answer2 == test_solution2
 
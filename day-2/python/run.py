@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 from enum import IntEnum
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import inputs
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 
 class Outcome(IntEnum):
@@ -53,36 +57,73 @@ def get_desired_move(their_move: Move, your_outcome: Outcome) -> Move:
     return to_beat(their_move)
 
 
-def solve_pt1(move_pairs: List[Tuple[str, str]]) -> int:
-    letter_to_their_move = dict(A=Move.Rock, B=Move.Paper, C=Move.Scissors)
-    letter_to_your_move = dict(X=Move.Rock, Y=Move.Paper, Z=Move.Scissors)
-    total_score = 0
-    for (them, you) in move_pairs:
-        their_move = letter_to_their_move[them]
-        your_move = letter_to_your_move[you]
-        your_outcome = get_outcome(their_move, your_move)
-        total_score += (your_outcome + your_move)
-    return total_score
-
-
-def solve_pt2(move_pairs: List[Tuple[str, str]]) -> int:
-    letter_to_their_move = dict(A=Move.Rock, B=Move.Paper, C=Move.Scissors)
-    letter_to_your_outcome = dict(X=Outcome.Lose, Y=Outcome.Draw, Z=Outcome.Win)
-    total_score = 0
-    for (them, you) in move_pairs:
-        their_move = letter_to_their_move[them]
-        your_outcome = letter_to_your_outcome[you]
-        your_move = get_desired_move(their_move, your_outcome)
-        total_score += (your_outcome + your_move)
-    return total_score
-
-
-def load(fpath: str) -> List[Tuple[str, str]]:
-    text = None
-    with open(fpath, "r") as f:
-        text = f.read()
-    parsed_text = [x.split(" ") for x in text.split("\n")]
-    return parsed_text
+THEIR_MOVES = dict(A=Move.Rock, B=Move.Paper, C=Move.Scissors)
+YOUR_MOVES = dict(X=Move.Rock, Y=Move.Paper, Z=Move.Scissors)
+YOUR_OUTCOMES = dict(X=Outcome.Lose, Y=Outcome.Draw, Z=Outcome.Win)
+
+# Every possible line of the guide with its score under both parts' reading of the second column,
+# so scoring a guide is only a matter of counting its lines
+SCORES = {
+    f"{them} {you}".encode(): (
+        get_outcome(THEIR_MOVES[them], YOUR_MOVES[you]) + YOUR_MOVES[you],
+        YOUR_OUTCOMES[you] + get_desired_move(THEIR_MOVES[them], YOUR_OUTCOMES[you]),
+    )
+    for them in THEIR_MOVES
+    for you in YOUR_MOVES
+}
+
+
+def count_lines(chunks: Iterable[bytes]) -> dict[bytes, int]:
+    # How often each possible line occurs. Every line of a guide is 3 bytes, so its line endings sit
+    # at a fixed stride; once that is checked, a line can only match by being one of the 9 patterns
+    # and counting them as substrings finds exactly the rounds. Otherwise the lines are checked one
+    # by one (the line endings may just be mixed) and any that isn't a round raises ValueError.
+    counts = dict.fromkeys(SCORES, 0)
+    for chunk in chunks:
+        body = chunk.rstrip(b"\r\n")
+        if not body:
+            continue
+        ending = b"\r\n" if (body[3:4] == b"\r") else b"\n"
+        width = 3 + len(ending)
+        n_rounds = (len(body) + len(ending)) // width
+        n_matched = 0
+        for line in SCORES:
+            n = body.count(line)
+            counts[line] += n
+            n_matched += n
+        laid_out = len(body) == n_rounds * width - len(ending)
+        laid_out = laid_out and all(
+            body[3 + k::width] == ending[k:k + 1] * (n_rounds - 1) for k in range(len(ending)))
+        if (not laid_out) or (n_matched != n_rounds):
+            for line in body.split(b"\n"):
+                if line.rstrip(b"\r") not in SCORES:
+                    raise ValueError(f"Not a round of the strategy guide: {line!r}")
+    return counts
+
+
+def solve_pt1(chunks: Iterable[bytes]) -> int:
+    (score1, _) = solve(chunks)
+    return score1
+
+
+def solve_pt2(chunks: Iterable[bytes]) -> int:
+    (_, score2) = solve(chunks)
+    return score2
+
+
+def solve(chunks: Iterable[bytes]) -> Tuple[int, int]:
+    counts = count_lines(chunks)
+    score1 = sum(n * SCORES[line][0] for (line, n) in counts.items())
+    score2 = sum(n * SCORES[line][1] for (line, n) in counts.items())
+    return (score1, score2)
+
+
+def stream(fpath: str) -> Iterator[bytes]:
+    return inputs.chunks(fpath)
+
+
+def load(fpath: str) -> List[bytes]:
+    return list(stream(fpath))
 
 
 def main() -> int:
@@ -1,9 +1,13 @@
+import sys
 import numpy as np
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import inputs
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 
 def mix(lst: list[int], num_times: int = 1) -> None:
@@ -57,11 +61,12 @@ def solve_pt2(data: list[int]) -> int:
     return mixed_sum
 
 
+def solve(data: list[int]) -> tuple[int, int]:
+    return (solve_pt1(data), solve_pt2(data))
+
+
 def load(fpath: str) -> list[int]:
-    text = None
-    with open(fpath, "r") as f:
-        text = f.read().split("\n")
-    data = list(map(int, text))
+    data = inputs.ints(fpath).tolist()
     return data
 
 
@@ -1,12 +1,11 @@
 import re
 from operator import add, eq, mul, sub, truediv
 from pathlib import Path
-from sympy import solve, sympify, Symbol
 from typing import Union
 
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 
 def flatten_eqn(monkeys: dict, name: str) -> list[Union[int, str]]:
@@ -38,11 +37,18 @@ def solve_pt2(monkeys: dict) -> int:
     monkeys["root"] = (m1, eq, m2)
     eqn = [*flatten_eqn(monkeys, m1), "=", *flatten_eqn(monkeys, m2)]
     eqn = "".join(map(str, map(op_to_str, eqn)))
-    sympy_eq = sympify("Eq(" + eqn.replace("=", ",") + ")")
-    humn = solve(sympy_eq, Symbol("humn"))[0]
+    # sympy takes longer to import than everything else here takes to run, so only part 2 pays for it
+    import sympy
+    sympy_eq = sympy.sympify("Eq(" + eqn.replace("=", ",") + ")")
+    humn = sympy.solve(sympy_eq, sympy.Symbol("humn"))[0]
     return humn
 
 
+def solve(monkeys: dict) -> tuple[int, int]:
+    # Part 1 writes the values it works out back into the dict, which would hide humn from part 2
+    return (solve_pt1(dict(monkeys)), solve_pt2(dict(monkeys)))
+
+
 def load(fpath: str) -> str:
     def is_number(s: str) -> bool:
         return True if (re.search(r"^\d+$", s) is not None) else False
@@ -1,12 +1,16 @@
 import re
+import sys
 import numpy as np
 from enum import IntEnum
 from pathlib import Path
 from typing import Union
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import grid
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 # Bit of a cheat but I'm too lazy to set up the face connectivity automatically :)
 
@@ -61,38 +65,37 @@ class Board:
 class FlatBoard(Board):
     def __init__(self, board: list[list[str]]) -> None:
         self.parse_board(board)
-        self.start = np.array([0, int(np.argwhere(self.board[0] == Tile.OpenTile)[0])])
-        self.pos = np.copy(self.start)
+        self.start = (0, int(grid.first_true(self.board[0] == Tile.OpenTile)))
+        self.pos = self.start
         self.direction = "R"
 
     def parse_board(self, board: list[list[str]]) -> str:
         tile_map = {".": Tile.OpenTile, "#": Tile.SolidWall, " ": Tile.OutOfBounds}
         data = [[x for x in map(lambda c: tile_map[c], line)] for line in board]
         self.board = np.array(data)
+        # Where each row and column enters and leaves the map, so wrapping is a lookup
+        on_map = self.board != Tile.OutOfBounds
+        (self.row_lo, self.row_hi) = (grid.first_true(on_map, 1).tolist(), grid.last_true(on_map, 1).tolist())
+        (self.col_lo, self.col_hi) = (grid.first_true(on_map, 0).tolist(), grid.last_true(on_map, 0).tolist())
+        self.walls = (self.board == Tile.SolidWall).tolist()
 
     def get_global_pos(self) -> Union[tuple[int, int], np.ndarray]:
         return self.pos
 
-    def is_off_map(self, pos: tuple[int, int]) -> bool:
-        if not ((0 <= pos[0] < self.board.shape[0]) and (0 <= pos[1] < self.board.shape[1])):
-            return True
-        if self.board[pos[0], pos[1]] == Tile.OutOfBounds:
-            return True
-        return False
+    def next_pos(self, pos: tuple[int, int]) -> tuple[int, int]:
+        (i, j) = pos
+        if self.direction == "R":
+            return (i, j + 1 if (j < self.row_hi[i]) else self.row_lo[i])
+        elif self.direction == "L":
+            return (i, j - 1 if (j > self.row_lo[i]) else self.row_hi[i])
+        elif self.direction == "D":
+            return (i + 1 if (i < self.col_hi[j]) else self.col_lo[j], j)
+        return (i - 1 if (i > self.col_lo[j]) else self.col_hi[j], j)
 
     def move_forward(self, n_space: int) -> None:
         for _ in range(n_space):
-            next_pos = self.pos + DirectionVectors[self.direction]
-            if self.is_off_map(next_pos):
-                if self.direction in ("L", "R"):
-                    row = self.board[self.pos[0]]
-                    ind = -1 if (self.direction == "L") else 0
-                    next_pos[1] = int(np.argwhere(row != Tile.OutOfBounds)[ind])
-                elif self.direction in ("U", "D"):
-                    col = self.board[:, self.pos[1]]
-                    ind = -1 if (self.direction == "U") else 0
-                    next_pos[0] = int(np.argwhere(col != Tile.OutOfBounds)[ind])
-            if self.board[next_pos[0], next_pos[1]] == Tile.SolidWall:
+            next_pos = self.next_pos(self.pos)
+            if self.walls[next_pos[0]][next_pos[1]]:
                 return
             self.pos = next_pos
 
@@ -112,7 +115,7 @@ class CubeBoard(Board):
         side_length: int,
     ) -> None:
         self.parse_board(board, side_length)
-        self.start = np.array([0, int(np.argwhere(self.get_face(1).data[0] == Tile.OpenTile)[0])])
+        self.start = np.array([0, int(grid.first_true(self.get_face(1).data[0] == Tile.OpenTile))])
         self.local_pos = np.copy(self.start)
         self.connectivity = connectivity
         self.face = 1
@@ -220,6 +223,15 @@ def solve_pt2(board: list[list[str]], moves: list[Union[int, str]], connectivity
     return board.get_password()
 
 
+def solve(
+    board: list[list[str]],
+    moves: list[Union[int, str]],
+    connectivity: dict,
+    side_length: int,
+) -> tuple[int, int]:
+    return (solve_pt1(board, moves), solve_pt2(board, moves, connectivity, side_length))
+
+
 def load(fpath: str) -> tuple[list[list[str]], list[Union[int, str]]]:
     text = None
     with open(fpath, "r") as f:
@@ -1,35 +1,80 @@
+import string
+import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
+import numpy as np
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import inputs
 
 
-def char_to_ind(c: str) -> int:
-    return ord(c) - (38 if c.isupper() else 96)
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
+# Item masks: an item sets the bit numbered by its priority (a-z 1-26, A-Z 27-52), so sets of items
+# are ORs of bits and their intersections ANDs. Other bytes, i.e. line endings, set no bit.
+BITS = np.zeros(256, dtype=np.uint64)
+BITS[np.frombuffer(string.ascii_letters.encode(), dtype=np.uint8)] = (
+    np.uint64(1) << np.arange(1, 53, dtype=np.uint64)
+)
 
-def solve_pt1(data: List[Tuple[str]]) -> int:
-    data = [(s[:len(s)//2], s[len(s)//2:]) for s in data]
-    wrongly_packed = [set(comp1) & set(comp2) for (comp1, comp2) in data]
-    priority_sum = sum([char_to_ind(next(iter(c))) for c in wrongly_packed])
+
+def compartments(chunk: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    # The item masks of both halves of every rucksack (line) in the chunk
+    buf = np.frombuffer(chunk, dtype=np.uint8)
+    ends = np.flatnonzero(buf == ord("\n"))
+    if (len(buf) > 0) and (buf[-1] != ord("\n")):  # the last line of the file has no line ending
+        ends = np.append(ends, len(buf))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    middles = (starts + ends) // 2
+    # OR-reducing between consecutive boundaries; each second half runs on to the next line's start,
+    # which only adds the line ending
+    halves = np.bitwise_or.reduceat(BITS[buf], np.stack((starts, middles), axis=1).ravel())
+    return (halves[0::2], halves[1::2])
+
+
+def priorities(items: np.ndarray) -> np.ndarray:
+    # Each mask must hold exactly one item, whose bit number is its priority
+    assert np.all((items != 0) & ((items & (items - np.uint64(1))) == 0))
+    return np.log2(items).astype(np.int64)
+
+
+def solve_pt1(chunks: Iterable[bytes]) -> int:
+    priority_sum = 0
+    for chunk in chunks:
+        (first, second) = compartments(chunk)
+        priority_sum += int(priorities(first & second).sum())
     return priority_sum
 
 
-def solve_pt2(data: List[Tuple[str]]) -> int:
-    assert len(data) % 3 == 0
-    groups = [data[3*i:3*i+3] for i in range(len(data) // 3)]
-    badges = [set(a) & set(b) & set(c) for (a, b, c) in groups]
-    priority_sum = sum([char_to_ind(next(iter(badge))) for badge in badges])
+def solve_pt2(chunks: Iterable[bytes]) -> int:
+    (_, priority_sum) = solve(chunks)
     return priority_sum
 
 
-def load(fpath: str) -> List[Tuple[str]]:
-    text = None
-    with open(fpath, "r") as f:
-        text = f.read().split("\n")
-    return text
+def solve(chunks: Iterable[bytes]) -> Tuple[int, int]:
+    (priority_sum1, priority_sum2) = (0, 0)
+    rest = np.zeros(0, dtype=np.uint64)  # the start of a group that runs on into the next chunk
+    for chunk in chunks:
+        (first, second) = compartments(chunk)
+        priority_sum1 += int(priorities(first & second).sum())
+        rucksacks = np.concatenate((rest, first | second))
+        cut = len(rucksacks) - len(rucksacks) % 3
+        badges = np.bitwise_and.reduce(rucksacks[:cut].reshape(-1, 3), axis=1)
+        priority_sum2 += int(priorities(badges).sum())
+        rest = rucksacks[cut:]
+    if len(rest) > 0:
+        raise ValueError("the elves don't split into groups of three")
+    return (priority_sum1, priority_sum2)
+
+
+def stream(fpath: str) -> Iterator[bytes]:
+    return inputs.chunks(fpath)
+
+
+def load(fpath: str) -> List[bytes]:
+    return list(stream(fpath))
 
 
 def main() -> int:
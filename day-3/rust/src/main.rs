@@ -1,5 +1,8 @@
 use itertools::Itertools;
 use std::collections::HashSet;
+use std::env;
+use std::fs;
+use std::time::Instant;
 
 fn char_to_u8(c: char) -> u8 {
     (c as u8) - if c.is_uppercase() { 38 } else { 96 }
@@ -32,7 +35,19 @@ fn solve_pt2(text: &str) -> u64 {
     sum
 }
 
+// Solves a single input for the cross-implementation harness (aoc/native.py), printing both
+// answers and the seconds spent loading and solving, one per line.
+fn run_harness(fname: String) {
+    let t0 = Instant::now();
+    let data = fs::read_to_string(fname).expect("Unable to load data!");
+    let (answer1, answer2) = (solve_pt1(&data), solve_pt2(&data));
+    println!("{}\n{}\n{}", answer1, answer2, t0.elapsed().as_secs_f64());
+}
+
 fn main() {
+    if let Some(fname) = env::args().nth(1) {
+        return run_harness(fname);
+    }
     let example_data: String = String::from(include_str!("./../../data/example.dat"));
     let test_data: String = String::from(include_str!("./../../data/test.dat"));
 
@@ -1,36 +1,91 @@
+import sys
+import numpy as np
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import inputs
+from aoc.intervals import IntervalIndex
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
 
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
-def solve_pt1(data: List[str]) -> int:
-    n_fully_contained = 0
-    for line in data:
-        (elf1, elf2) = [list(map(int, rng.split("-"))) for rng in line.split(",")]
-        (elf1, elf2) = (set(range(elf1[0], elf1[1] + 1)), set(range(elf2[0], elf2[1] + 1)))
-        if len(elf1 | elf2) == max(len(elf1), len(elf2)):
-            n_fully_contained += 1
+
+# The pairs come in (n, 4) int arrays whose columns are (lo1, hi1, lo2, hi2), both ranges closed.
+# The checks below compare the bounds only, so they work on whole columns at once and cost the
+# same however wide the ranges are.
+
+
+def fully_contained(lo1: np.ndarray, hi1: np.ndarray, lo2: np.ndarray, hi2: np.ndarray) -> np.ndarray:
+    return ((lo1 <= lo2) & (hi2 <= hi1)) | ((lo2 <= lo1) & (hi1 <= hi2))
+
+
+def overlapping(lo1: np.ndarray, hi1: np.ndarray, lo2: np.ndarray, hi2: np.ndarray) -> np.ndarray:
+    return (lo1 <= hi2) & (lo2 <= hi1)
+
+
+def solve_pt1(data: Iterable[np.ndarray]) -> int:
+    n_fully_contained = sum(int(fully_contained(*pairs.T).sum()) for pairs in data)
     return n_fully_contained
 
 
-def solve_pt2(data: List[str]) -> int:
-    n_overlap = 0
-    for line in data:
-        (elf1, elf2) = [list(map(int, rng.split("-"))) for rng in line.split(",")]
-        overlap = set(range(elf1[0], elf1[1] + 1)) & set(range(elf2[0], elf2[1] + 1))
-        if len(overlap) > 0:
-            n_overlap += 1
+def solve_pt2(data: Iterable[np.ndarray]) -> int:
+    n_overlap = sum(int(overlapping(*pairs.T).sum()) for pairs in data)
     return n_overlap
 
 
-def load(fpath: str) -> List[str]:
-    text = None
-    with open(fpath, "r") as f:
-        text = f.read().split("\n")
-    return text
+def solve(data: Iterable[np.ndarray]) -> Tuple[int, int]:
+    (n_fully_contained, n_overlap) = (0, 0)
+    for pairs in data:
+        n_fully_contained += int(fully_contained(*pairs.T).sum())
+        n_overlap += int(overlapping(*pairs.T).sum())
+    return (n_fully_contained, n_overlap)
+
+
+def coverage_index(data: Iterable[np.ndarray]) -> IntervalIndex:
+    # Every elf's assignment as an interval, for repeated coverage questions over the same list.
+    # Pair i's elves are intervals 2i and 2i + 1.
+    pairs = np.concatenate([np.zeros((0, 4), dtype=np.int64), *data])
+    return IntervalIndex(pairs[:, 0::2].ravel(), pairs[:, 1::2].ravel())
+
+
+def pairs_overlapping(index: IntervalIndex, lo: int, hi: int) -> np.ndarray:
+    # The pairs with at least one elf assigned a section in [lo, hi]
+    return np.unique(index.overlapping(lo, hi) // 2)
+
+
+def check_coverage_index(data: List[np.ndarray]) -> None:
+    # The index's answers against direct computation: stabbing counts for every section, the pairs
+    # touching each section, and both parts' counts worked out from overlap queries alone
+    pairs = np.concatenate(data)
+    index = coverage_index(data)
+    (lo, hi) = (pairs[:, 0::2].ravel(), pairs[:, 1::2].ravel())
+    sections = np.arange(lo.min() - 1, hi.max() + 2)
+    covering = (lo[:, None] <= sections) & (sections <= hi[:, None])
+    assert np.array_equal(index.counts(sections), covering.sum(axis=0))
+    for x in sections:
+        touched = np.flatnonzero(covering[0::2, x - sections[0]] | covering[1::2, x - sections[0]])
+        assert np.array_equal(pairs_overlapping(index, x, x), touched)
+
+    def covers(elf: int, lo: int, hi: int) -> bool:
+        return (elf in index.overlapping(lo, lo)) and (elf in index.overlapping(hi, hi))
+
+    n_fully_contained = sum(
+        covers(2 * i, lo2, hi2) or covers(2 * i + 1, lo1, hi1)
+        for (i, (lo1, hi1, lo2, hi2)) in enumerate(pairs)
+    )
+    n_overlap = sum((2 * i + 1) in index.overlapping(lo1, hi1) for (i, (lo1, hi1, _, _)) in enumerate(pairs))
+    assert (n_fully_contained, n_overlap) == (solve_pt1(data), solve_pt2(data))
+
+
+def stream(fpath: str) -> Iterator[np.ndarray]:
+    # One (n, 4) array per chunk of the file; '-' separates the bounds here, it's never a sign
+    return (block.reshape(-1, 4) for block in inputs.int_blocks(fpath, pattern=rb"\d+"))
+
+
+def load(fpath: str) -> List[np.ndarray]:
+    return list(stream(fpath))
 
 
 def main() -> int:
@@ -50,6 +105,9 @@ def main() -> int:
     assert answer2 == example_answer2
     print(f"[TEST] Answer to Part 2: {solve_pt2(data2)}")
 
+    check_coverage_index(data1)
+    check_coverage_index(data2)
+
 
 if __name__ == "__main__":
     main()
@@ -1,52 +1,103 @@
-from copy import deepcopy
-from dataclasses import dataclass
+import sys
 from pathlib import Path
+from typing import Iterable, Iterator
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import inputs
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
 
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
-def get_message(crates: list[list[str]]) -> None:
+
+Move = tuple[int, int, int]  # (number of crates, start, end), stacks numbered from 0
+
+
+def get_message(crates: list[list[str]]) -> str:
     return "".join([stack[-1] for stack in crates if len(stack) > 0])
 
 
-def solve_pt1(crates: list[list[str]], moves: list[tuple[int, int, int]]) -> int:
+def copy_stacks(crates: list[list[str]]) -> list[list[str]]:
+    # Crates are strings, so copying each stack is enough for the solvers to move them freely
+    return [stack.copy() for stack in crates]
+
+
+# Moves change both stacks in place, costing the number of crates moved rather than the stacks' height
+
+
+def move_one_at_a_time(crates: list[list[str]], n: int, start: int, end: int) -> None:
+    if start == end:  # taking crates off a stack and putting them back leaves it as it was
+        return
+    cut = len(crates[start]) - n
+    crates[end].extend(reversed(crates[start][cut:]))
+    del crates[start][cut:]
+
+
+def move_all_at_once(crates: list[list[str]], n: int, start: int, end: int) -> None:
+    if start == end:
+        return
+    cut = len(crates[start]) - n
+    crates[end].extend(crates[start][cut:])
+    del crates[start][cut:]
+
+
+def solve_pt1(crates: list[list[str]], moves: Iterable[Move]) -> str:
+    crates = copy_stacks(crates)
     for (n, start, end) in moves:
-        crates[end] = crates[end] + crates[start][-n:][::-1]
-        crates[start] = crates[start][:-n]
+        move_one_at_a_time(crates, n, start, end)
     return get_message(crates)
 
 
-def solve_pt2(crates: list[list[str]], moves: list[tuple[int, int, int]]) -> int:
+def solve_pt2(crates: list[list[str]], moves: Iterable[Move]) -> str:
+    crates = copy_stacks(crates)
     for (n, start, end) in moves:
-        crates[end] = crates[end] + crates[start][-n:]
-        crates[start] = crates[start][:-n]
+        move_all_at_once(crates, n, start, end)
     return get_message(crates)
 
 
-def load(fpath: str) -> tuple[list[list[str]], list[tuple[int, int, int]]]:
-    lines = None
-    with open(fpath, "r") as f:
-        lines = f.read().split("\n")
+def solve(crates: list[list[str]], moves: Iterable[Move]) -> tuple[str, str]:
+    # Both cranes in one pass over the moves, each on its own copy of the stacks, so a streamed
+    # move log only has to be read once
+    (crates1, crates2) = (copy_stacks(crates), copy_stacks(crates))
+    for (n, start, end) in moves:
+        move_one_at_a_time(crates1, n, start, end)
+        move_all_at_once(crates2, n, start, end)
+    return (get_message(crates1), get_message(crates2))
+
+
+def parse_moves(lines: Iterator[str]) -> Iterator[Move]:
+    for line in lines:
+        if line:
+            (num_crate, start, end) = map(int, line.split(" ")[1::2])
+            yield (num_crate, start - 1, end - 1)
+
 
-    stack_height = next(i for (i, l) in enumerate(lines) if l.startswith(" 1"))
-    crates_info = lines[:stack_height]
+def parse(lines: Iterable[str]) -> tuple[list[list[str]], Iterator[Move]]:
+    # The stack diagram is read up front, but the moves are only parsed as they are consumed, so a
+    # move log of any length (from a file, or a pipe such as sys.stdin) is never held in memory
+    lines = iter(lines)
+    diagram = []
+    for line in lines:
+        if line.startswith(" 1"):
+            n_column = int(line.split()[-1])
+            break
+        diagram += [line]
 
-    n_column = int(lines[stack_height].strip().split(" ")[-1])
     crates = [[] for _ in range(n_column)]
-    for line in crates_info[::-1]:
-        crate_labels = [line[4 * i + 1] for i in range(n_column)]
-        for (i, letter) in enumerate(crate_labels):
+    for line in reversed(diagram):
+        for (i, letter) in enumerate(line[1::4]):
             if letter != " ":
-                crates[i] += letter
+                crates[i].append(letter)
+    return (crates, parse_moves(line.rstrip("\n") for line in lines))
 
-    moves_info = lines[stack_height + 2:]
-    moves = [None] * len(moves_info)
-    for (i, line) in enumerate(moves_info):
-        (num_crate, start, end) = list(map(int, line.split(" ")[1::2]))
-        moves[i] = (num_crate, start - 1, end - 1)
-    return (crates, moves)
+
+def stream(fpath: str) -> tuple[list[list[str]], Iterator[Move]]:
+    return parse(inputs.text_lines(fpath))
+
+
+def load(fpath: str) -> tuple[list[list[str]], list[Move]]:
+    (crates, moves) = stream(fpath)
+    return (crates, list(moves))
 
 
 def main() -> int:
@@ -58,20 +109,24 @@ def main() -> int:
     test_answer1 = "SBPQRSCDF"
     test_answer2 = "RGLVRCQSB"
 
-    answer11 = solve_pt1(deepcopy(crates_example), deepcopy(moves_example))
-    answer12 = solve_pt1(deepcopy(crates_test), deepcopy(moves_test))
+    answer11 = solve_pt1(crates_example, moves_example)
+    answer12 = solve_pt1(crates_test, moves_test)
     print(f"[EXAMPLE] Answer to Part 1: {answer11}")
     print(f"[TEST] Answer to Part 1: {answer12}")
     assert answer11 == example_answer1
     assert answer12 == test_answer1
 
-    answer21 = solve_pt2(deepcopy(crates_example), deepcopy(moves_example))
-    answer22 = solve_pt2(deepcopy(crates_test), deepcopy(moves_test))
+    answer21 = solve_pt2(crates_example, moves_example)
+    answer22 = solve_pt2(crates_test, moves_test)
     print(f"[EXAMPLE] Answer to Part 2: {answer21}")
     print(f"[TEST] Answer to Part 2: {answer22}")
     assert answer21 == example_answer2
     assert answer22 == test_answer2
 
+    # A move onto the stack it comes from changes nothing
+    assert solve_pt1([["A", "B", "C"]], [(2, 0, 0)]) == "C"
+    assert solve_pt2([["A", "B", "C"]], [(2, 0, 0)]) == "C"
+
 
 if __name__ == "__main__":
     main()
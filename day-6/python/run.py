@@ -1,12 +1,12 @@
 from pathlib import Path
 
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 
-def find_unique_substring_marker(s: str, size: int) -> int:
-    return size + [i for i in range(len(s) - size + 1) if len(set(s[i:i + size])) == size][0]
+def find_unique_substring_marker(s: str, size: int, start: int = 0) -> int:
+    return size + [i for i in range(start, len(s) - size + 1) if len(set(s[i:i + size])) == size][0]
 
 
 def solve_pt1(line: str) -> int:
@@ -17,6 +17,13 @@ def solve_pt2(line: str) -> int:
     return find_unique_substring_marker(line, size=14)
 
 
+def solve(line: str) -> tuple[int, int]:
+    # Any window of 14 distinct characters contains one of 4, so the second search can start at
+    # the first marker's window
+    packet_marker = find_unique_substring_marker(line, size=4)
+    return (packet_marker, find_unique_substring_marker(line, size=14, start=packet_marker - 4))
+
+
 def load(fpath: str) -> str:
     text = None
     with open(fpath, "r") as f:
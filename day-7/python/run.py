@@ -9,9 +9,9 @@ from typing import Optional, Union
 
 # -------------------------------------------------------------------------------------------------
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-ANSWER_DATA_PATH = Path.cwd().parent / "data" / "answer1.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+ANSWER_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "answer1.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
 # -------------------------------------------------------------------------------------------------
 
@@ -84,36 +84,43 @@ Root = Directory
 
 # -------------------------------------------------------------------------------------------------
 
-def solve_pt1(root: Root) -> int:
-    def _get_matching_dirs(root: Directory) -> list[Directory]:
-        matching_dirs = []
-        if root.size <= 100_000:
-            matching_dirs += [root]
-        for child in root.children:
-            if is_dir(child):
-                matching_dirs += _get_matching_dirs(child)
-        return matching_dirs
+def dir_sizes(root: Root) -> list[int]:
+    # Sizes of every directory in one post-order walk (root last), instead of re-summing each
+    # subtree through Directory.size
+    sizes = []
 
-    dirs = _get_matching_dirs(root)
-    total_size = sum([d.size for d in dirs])
-    return total_size
+    def _walk(d: Directory) -> int:
+        size = 0
+        for child in d.children:
+            size += _walk(child) if is_dir(child) else child.size
+        sizes.append(size)
+        return size
 
+    _walk(root)
+    return sizes
 
-def solve_pt2(root: Root) -> int:
-    def _flatten_dirs(root: Directory) -> list[Directory]:
-        matching_dirs = [root]
-        for child in root.children:
-            if is_dir(child):
-                matching_dirs += _flatten_dirs(child)
-        return matching_dirs
 
+def sum_small_dirs(sizes: list[int]) -> int:
+    return sum([s for s in sizes if s <= 100_000])
+
+
+def smallest_dir_to_delete(sizes: list[int]) -> int:
     DISK_SPACE_THRESHOLD = 40_000_000
-    need_to_free = root.size - DISK_SPACE_THRESHOLD
-    all_dirs = _flatten_dirs(root)
-    sorted_dirs = sorted(all_dirs, key=lambda d: d.size)
-    for d in sorted_dirs:
-        if d.size > need_to_free:
-            return d.size
+    need_to_free = sizes[-1] - DISK_SPACE_THRESHOLD
+    return min([s for s in sizes if s > need_to_free])
+
+
+def solve_pt1(root: Root) -> int:
+    return sum_small_dirs(dir_sizes(root))
+
+
+def solve_pt2(root: Root) -> int:
+    return smallest_dir_to_delete(dir_sizes(root))
+
+
+def solve(root: Root) -> tuple[int, int]:
+    sizes = dir_sizes(root)
+    return (sum_small_dirs(sizes), smallest_dir_to_delete(sizes))
 
 
 def parse(commands: list[str]) -> Root:
@@ -1,40 +1,40 @@
+import sys
 import numpy as np
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import grid
 
-EXAMPLE_DATA_PATH = Path.cwd().parent / "data" / "example.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
+
+EXAMPLE_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "example.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
+
+# (axis, reverse) for looking left, right, up and down
+DIRECTIONS = ((1, True), (1, False), (0, True), (0, False))
 
 
 def solve_pt1(x: np.ndarray) -> int:
-    (m, n) = x.shape
-    visible_trees = 2 * (m + n) - 4
-    for i in range(1, m - 1):
-        for j in range(1, n - 1):
-            tree = x[i, j]
-            (left, right, up, down) = (x[i, :j], x[i, j + 1:], x[:i, j], x[i + 1:, j])
-            if any(np.all(tree > other) for other in (left[::-1], right, up[::-1], down)):
-                visible_trees += 1
-    return visible_trees
+    visible = np.zeros(x.shape, dtype=bool)
+    for (axis, reverse) in DIRECTIONS:
+        visible |= x > grid.prefix_max(x, axis, reverse)
+    return int(visible.sum())
 
 
 def solve_pt2(x: np.ndarray) -> int:
-    def view_dist(tree, others):
-        return next((i + 1 for (i, t) in enumerate(others) if t >= tree), len(others))
     (m, n) = x.shape
-    max_scenic_score = 0
-    for i in range(1, m - 1):
-        for j in range(1, n - 1):
-            tree = x[i, j]
-            (left, right, up, down) = (x[i, :j], x[i, j + 1:], x[:i, j], x[i + 1:, j])
-            n_left = view_dist(tree, left[::-1])
-            n_right = view_dist(tree, right)
-            n_up = view_dist(tree, up[::-1])
-            n_down = view_dist(tree, down)
-            scenic_score = n_left * n_right * n_up * n_down
-            if scenic_score > max_scenic_score:
-                max_scenic_score = scenic_score
-    return max_scenic_score
+    pos = {0: np.arange(m)[:, None], 1: np.arange(n)[None, :]}
+    scenic_score = np.ones(x.shape, dtype=np.int64)
+    for (axis, reverse) in DIRECTIONS:
+        # Distance to the nearest tree at least as tall as each possible height, or to the edge
+        blockers = np.stack([grid.next_index(x >= h, axis, reverse) for h in range(10)])
+        blockers = np.clip(blockers, 0, x.shape[axis] - 1)
+        dist = np.abs(np.take_along_axis(blockers, x[None], axis=0)[0] - pos[axis])
+        scenic_score *= dist
+    return int(scenic_score.max())
+
+
+def solve(x: np.ndarray) -> tuple[int, int]:
+    return (solve_pt1(x), solve_pt2(x))
 
 
 def load(fpath: str) -> np.ndarray:
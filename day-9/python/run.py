@@ -1,41 +1,67 @@
-import numpy as np
+import sys
 from pathlib import Path
+from typing import Iterable, Iterator
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import inputs
 
-EXAMPLE_DATA_PT1_PATH = Path.cwd().parent / "data" / "example_pt1.dat"
-EXAMPLE_DATA_PT2_PATH = Path.cwd().parent / "data" / "example_pt2.dat"
-TEST_DATA_PATH = Path.cwd().parent / "data" / "test.dat"
 
+EXAMPLE_DATA_PT1_PATH = Path(__file__).resolve().parent.parent / "data" / "example_pt1.dat"
+EXAMPLE_DATA_PT2_PATH = Path(__file__).resolve().parent.parent / "data" / "example_pt2.dat"
+TEST_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "test.dat"
 
-def simulate(n_knot: int, moves: list[tuple[str, int]]) -> int:
-    direction_vector_map = {"L": [-1, 0], "R": [1, 0], "U": [0, 1], "D": [0, -1]}
-    tail_history = {(0, 0)}
-    n_knot = n_knot
-    knots = [np.array([0, 0], dtype=int) for _ in range(n_knot)]
+
+Move = tuple[str, int]
+
+
+def sign(v: int) -> int:
+    return (v > 0) - (v < 0)
+
+
+def simulate(n_knot: int, moves: Iterable[Move], tracked: tuple[int, ...] = (-1,)) -> list[int]:
+    # Number of positions visited by each tracked knot. Knot k of a long rope moves exactly like
+    # the tail of a (k + 1)-knot rope, so one simulation can answer several rope lengths.
+    direction_vector_map = {"L": (-1, 0), "R": (1, 0), "U": (0, 1), "D": (0, -1)}
+    histories = [{(0, 0)} for _ in tracked]
+    (xs, ys) = ([0] * n_knot, [0] * n_knot)
     for (direction, amount) in moves:
+        (dx, dy) = direction_vector_map[direction]
         for _ in range(amount):
-            knots[0] += direction_vector_map[direction]
+            xs[0] += dx
+            ys[0] += dy
             for i in range(1, n_knot):
-                disp = knots[i - 1] - knots[i]
-                if np.max(np.abs(knots[i - 1] - knots[i])) > 1:
-                    knots[i] += np.sign(disp) * np.ceil(np.abs(disp) / 2).astype(int)
-            tail_history |= {tuple(knots[-1].tolist())}
-    return len(tail_history)
+                # A knot is never more than 2 away from the one ahead, so it catches up by one step
+                # along each axis it's behind on
+                (disp_x, disp_y) = (xs[i - 1] - xs[i], ys[i - 1] - ys[i])
+                if max(abs(disp_x), abs(disp_y)) > 1:
+                    xs[i] += sign(disp_x)
+                    ys[i] += sign(disp_y)
+            for (history, k) in zip(histories, tracked):
+                history.add((xs[k], ys[k]))
+    return [len(history) for history in histories]
+
+
+def solve_pt1(moves: Iterable[Move]) -> int:
+    return simulate(n_knot=2, moves=moves)[0]
+
+
+def solve_pt2(moves: Iterable[Move]) -> int:
+    return simulate(n_knot=10, moves=moves)[0]
 
 
-def solve_pt1(moves: list[tuple[str, int]]) -> int:
-    return simulate(n_knot=2, moves=moves)
+def solve(moves: Iterable[Move]) -> tuple[int, int]:
+    (visited1, visited9) = simulate(n_knot=10, moves=moves, tracked=(1, 9))
+    return (visited1, visited9)
 
 
-def solve_pt2(moves: list[tuple[str, int]]) -> int:
-    return simulate(n_knot=10, moves=moves)
+def stream(fpath: str) -> Iterator[Move]:
+    for line in inputs.lines(fpath):
+        (direction, amount) = line.split(b" ")
+        yield (direction.decode(), int(amount))
 
 
-def load(fpath: str) -> str:
-    with open(fpath, "r") as f:
-        moves = [line.split(" ") for line in f.read().split("\n")]
-    moves = [(direction, int(amount)) for (direction, amount) in moves]
-    return moves
+def load(fpath: str) -> list[Move]:
+    return list(stream(fpath))
 
 
 def main() -> int:
@@ -1,4 +1,5 @@
 #include <cassert>
+#include <chrono>
 #include <filesystem>
 #include <fstream>
 #include <iostream>
@@ -79,12 +80,32 @@ auto solve_pt1(const std::string &text) -> uint64_t { return 0; }
  ****************************************************************************************/
 auto solve_pt2(const std::string &text) -> uint64_t { return 0; }
 
+/****************************************************************************************
+ * @brief Solves a single input for the cross-implementation harness (aoc/native.py),
+ * printing both answers and the seconds spent loading and solving, one per line.
+ *
+ * @param fpath:
+ * @return int:
+ ****************************************************************************************/
+auto run_harness(const fs::path &fpath) -> int {
+  auto t0 = std::chrono::steady_clock::now();
+  std::string data = load(fpath);
+  auto answer1 = solve_pt1(data);
+  auto answer2 = solve_pt2(data);
+  std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - t0;
+  fmt::print("{}\n{}\n{}\n", answer1, answer2, elapsed.count());
+  return 0;
+}
+
 /****************************************************************************************
  * @brief
  *
  * @return int:
  ****************************************************************************************/
-auto main() -> int {
+auto main(int argc, char *argv[]) -> int {
+  if (argc > 1) {
+    return run_harness(argv[1]);
+  }
   bool enable_example_part2 = false;
   bool enable_test_part1 = false;
   bool enable_test_part2 = false;